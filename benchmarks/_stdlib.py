@@ -0,0 +1,8 @@
+"""Setup shared by the benchmarks that look at every loaded module."""
+import importlib
+
+
+def load_standard_library() -> None:
+    """Loads a decent amount of the standard library, to get a realistic mix of module sizes"""
+    for mod_name in ('asyncio', 'decimal', 'email.utils', 'http.client', 'json', 'logging.handlers', 'unittest'):
+        importlib.import_module(mod_name)
@@ -0,0 +1,34 @@
+"""
+Cost of arithmetic on the fake datetime classes, and of asking them for the current time.
+
+Report generation and the like do lots of date arithmetic, which goes through the fakes while time is frozen.
+"""
+import datetime
+import timeit
+
+from freezegun import freeze_time
+from freezegun.api import FakeDate, FakeDatetime, real_date, real_datetime
+
+DAY = datetime.timedelta(days=1)
+
+
+def main() -> None:
+    number = 200000
+    cases = (
+        ('datetime + timedelta', lambda: real_datetime(2012, 1, 14) + DAY, lambda: FakeDatetime(2012, 1, 14) + DAY),
+        ('datetime - timedelta', lambda: real_datetime(2012, 1, 14) - DAY, lambda: FakeDatetime(2012, 1, 14) - DAY),
+        ('date + timedelta', lambda: real_date(2012, 1, 14) + DAY, lambda: FakeDate(2012, 1, 14) + DAY),
+    )
+    for label, real, fake in cases:
+        real_duration = min(timeit.repeat(real, number=number, repeat=5)) / number
+        fake_duration = min(timeit.repeat(fake, number=number, repeat=5)) / number
+        print(f'{label:>22}: real {real_duration * 1e9:7.1f} ns, fake {fake_duration * 1e9:7.1f} ns')
+
+    with freeze_time('2012-01-14'):
+        for label, call in (('datetime.now()', FakeDatetime.now), ('date.today()', FakeDate.today)):
+            duration = min(timeit.repeat(call, number=number, repeat=5)) / number
+            print(f'{label:>22}: frozen {duration * 1e9:7.1f} ns')
+
+
+if __name__ == '__main__':
+    main()
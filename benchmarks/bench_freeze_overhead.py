@@ -0,0 +1,35 @@
+"""
+Cost of entering and leaving ``freeze_time()``, with and without the fakes installed for good.
+"""
+import timeit
+
+import freezegun
+from freezegun import freeze_time
+
+from _stdlib import load_standard_library
+
+load_standard_library()
+
+
+def freeze_and_thaw() -> None:
+    with freeze_time('2012-01-14'):
+        pass
+
+
+def main() -> None:
+    number = 2000
+    freeze_and_thaw()
+
+    duration = min(timeit.repeat(freeze_and_thaw, number=number, repeat=5))
+    print(f'{"patching every freeze":>24}: {duration / number * 1e6:8.1f} us per freeze')
+
+    freezegun.install_fakes()
+    try:
+        duration = min(timeit.repeat(freeze_and_thaw, number=number, repeat=5))
+    finally:
+        freezegun.uninstall_fakes()
+    print(f'{"fakes installed":>24}: {duration / number * 1e6:8.1f} us per freeze')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+Cost of analyzing a module that was not seen before, like on the first freeze of a process.
+"""
+import sys
+import timeit
+import types
+from typing import Dict
+from unittest import mock
+
+from freezegun import api
+
+from _stdlib import load_standard_library
+
+load_standard_library()
+
+
+def analyze_all(modules: Dict[str, types.ModuleType]) -> None:
+    for mod_name, module in modules.items():
+        api._setup_module_cache(mod_name, module)
+        api._forget_module(mod_name)
+
+
+def main() -> None:
+    modules = {mod_name: module for mod_name, module in list(sys.modules.items()) if isinstance(module, types.ModuleType)}
+    number = 20
+
+    duration = min(timeit.repeat(lambda: analyze_all(modules), number=number, repeat=5))
+    print(f'{"with prefilter":>20}: {duration / number / len(modules) * 1e6:8.3f} us per module ({len(modules)} modules)')
+
+    # Without any ids to rule modules out, every module gets enumerated
+    with mock.patch('freezegun.api._time_object_ids', _NeverDisjoint()):
+        duration = min(timeit.repeat(lambda: analyze_all(modules), number=number, repeat=5))
+    print(f'{"without prefilter":>20}: {duration / number / len(modules) * 1e6:8.3f} us per module ({len(modules)} modules)')
+
+
+class _NeverDisjoint:
+    def isdisjoint(self, other: object) -> bool:
+        return False
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""
+Cost of checking whether the cached analysis of a module is still valid.
+
+Once a time object picked up a new reference, ``start()`` runs this check for every analyzed module,
+so it is reported per module.
+"""
+import sys
+import timeit
+import types
+
+from freezegun import api
+
+from _stdlib import load_standard_library
+
+load_standard_library()
+
+
+def dir_hash(module: types.ModuleType) -> str:
+    # What the cache used to compare on every start()
+    try:
+        module_dir = dir(module)
+    except (ImportError, TypeError):
+        module_dir = []
+    return f'{id(module)}-{hash(frozenset(module_dir))}'
+
+
+def main() -> None:
+    modules = [module for module in list(sys.modules.values()) if isinstance(module, types.ModuleType)]
+    number = 20
+
+    for label, check in (('dir() + frozenset hash', dir_hash), ('fingerprint', api._get_module_fingerprint)):
+        duration = min(timeit.repeat(lambda: [check(module) for module in modules], number=number, repeat=5))
+        print(f'{label:>24}: {duration / number / len(modules) * 1e6:8.3f} us per module ({len(modules)} modules)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Memory held by the module cache, while modules are loaded and after they got discarded.
+
+Modules that are imported and thrown away again (like in long running IPython sessions or plugin heavy suites)
+should be freed right away, not once the next freeze notices they are gone.
+"""
+import gc
+import sys
+import time
+import tracemalloc
+import types
+
+from freezegun import freeze_time
+
+MODULE_COUNT = 1000
+PAYLOAD_SIZE = 10000
+
+
+def make_modules() -> None:
+    for index in range(MODULE_COUNT):
+        module = types.ModuleType(f'discarded_module_{index}')
+        module.now = time.time  # type: ignore[attr-defined]
+        module.payload = bytes(PAYLOAD_SIZE)  # type: ignore[attr-defined]
+        sys.modules[module.__name__] = module
+
+
+def discard_modules() -> None:
+    for index in range(MODULE_COUNT):
+        del sys.modules[f'discarded_module_{index}']
+    gc.collect()
+
+
+def main() -> None:
+    with freeze_time('2012-01-14'):
+        pass
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    make_modules()
+    loaded = tracemalloc.get_traced_memory()[0]
+    with freeze_time('2012-01-14'):
+        pass
+    cached = tracemalloc.get_traced_memory()[0]
+    print(f'{"cache per module":>32}: {(cached - loaded) / MODULE_COUNT:10.0f} bytes')
+
+    discard_modules()
+    discarded = tracemalloc.get_traced_memory()[0]
+    print(f'{"kept after discarding modules":>32}: {(discarded - baseline) / 1024:10.0f} KiB')
+
+    with freeze_time('2012-01-14'):
+        pass
+    gc.collect()
+    print(f'{"kept after the next freeze":>32}: {(tracemalloc.get_traced_memory()[0] - baseline) / 1024:10.0f} KiB')
+
+
+if __name__ == '__main__':
+    main()
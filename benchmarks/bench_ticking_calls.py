@@ -0,0 +1,23 @@
+"""
+Throughput of the fakes in ticking mode, next to the same calls with the time frozen in place.
+
+Ticking freezes work out the time from a real clock on every read, frozen ones hand out the same instant.
+"""
+import datetime
+import time
+import timeit
+
+from freezegun import freeze_time
+
+
+def main() -> None:
+    number = 200000
+    for mode, tick in (('frozen', False), ('ticking', True)):
+        with freeze_time('2012-01-14', tick=tick):
+            for label, call in (('time.time()', time.time), ('time.time_ns()', time.time_ns), ('datetime.now()', datetime.datetime.now)):
+                duration = min(timeit.repeat(call, number=number, repeat=5))
+                print(f'{mode:>8} {label:>16}: {number / duration / 1e6:6.2f} M calls/s, {duration / number * 1e9:7.1f} ns per call')
+
+
+if __name__ == '__main__':
+    main()
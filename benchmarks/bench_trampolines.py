@@ -0,0 +1,29 @@
+"""
+Cost of calling the fakes while nothing is frozen.
+
+With ``configure(rebind_on_import=True)`` modules hold on to the fakes for good, so every call
+to ``time.time()`` or ``datetime.now()`` goes through them, frozen or not.
+"""
+import timeit
+
+from freezegun import api
+
+
+def main() -> None:
+    number = 200000
+    cases = (
+        ('time()', api.real_time, api.fake_time),
+        ('monotonic()', api.real_monotonic, api.fake_monotonic),
+        ('datetime.now()', api.real_datetime.now, api.FakeDatetime.now),
+        ('date.today()', api.real_date.today, api.FakeDate.today),
+    )
+
+    for label, real, fake in cases:
+        real_duration = min(timeit.repeat(real, number=number, repeat=5)) / number
+        fake_duration = min(timeit.repeat(fake, number=number, repeat=5)) / number
+        print(f'{label:>16}: real {real_duration * 1e9:7.1f} ns, fake {fake_duration * 1e9:7.1f} ns, '
+              f'{(fake_duration - real_duration) * 1e9:+7.1f} ns per call')
+
+
+if __name__ == '__main__':
+    main()
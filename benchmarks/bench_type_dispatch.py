@@ -0,0 +1,50 @@
+"""
+Cost of isinstance() dispatch against the patched datetime classes, the way serializers and validators do it.
+
+Serializes a million objects with a json style ``default`` hook, without freezing and while time is frozen.
+"""
+import datetime
+import decimal
+import json
+import uuid
+from typing import Any, List
+
+from freezegun import api, freeze_time
+from freezegun.api import real_date, real_datetime
+
+
+def default(obj: Any) -> Any:
+    if isinstance(obj, datetime.datetime):
+        return obj.isoformat()
+    if isinstance(obj, datetime.date):
+        return obj.isoformat()
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    raise TypeError(type(obj).__name__)
+
+
+def make_objects(count: int) -> List[Any]:
+    samples = (real_datetime(2012, 1, 14, 12), real_date(2012, 1, 14), decimal.Decimal('1.5'), uuid.UUID(int=1))
+    return [samples[i % len(samples)] for i in range(count)]
+
+
+def serialize(objects: List[Any]) -> float:
+    encoder = json.JSONEncoder(default=default)
+    start = api.real_perf_counter()
+    encoder.encode(objects)
+    duration: float = api.real_perf_counter() - start
+    return duration
+
+
+def main() -> None:
+    objects = make_objects(1000000)
+    unfrozen = min(serialize(objects) for _ in range(3))
+    with freeze_time('2012-01-14'):
+        frozen = min(serialize(objects) for _ in range(3))
+    print(f'{len(objects)} objects: unfrozen {unfrozen:.3f}s, frozen {frozen:.3f}s ({frozen / unfrozen:.2f}x)')
+
+
+if __name__ == '__main__':
+    main()
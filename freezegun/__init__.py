@@ -5,8 +5,9 @@ freezegun
 :copyright: (c) 2012 by Steve Pulec.
 
 """
-from .api import freeze_time
+from .api import freeze_time, install_fakes, uninstall_fakes, use_real_time as real_time, warmup
 from .config import configure
+from ._async import VirtualTimeEventLoop
 
 __title__ = 'freezegun'
 __version__ = '1.5.5'
@@ -15,4 +16,4 @@ __license__ = 'Apache License 2.0'
 __copyright__ = 'Copyright 2012 Steve Pulec'
 
 
-__all__ = ["freeze_time", "configure"]
+__all__ = ["freeze_time", "configure", "install_fakes", "uninstall_fakes", "real_time", "warmup", "VirtualTimeEventLoop"]
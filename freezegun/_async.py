@@ -1,8 +1,11 @@
+import asyncio
 import functools
-from typing import Any, Callable, TypeVar, cast
+import selectors
+from typing import Any, Callable, List, Optional, Tuple, TypeVar, cast
 
 
 _CallableT = TypeVar("_CallableT", bound=Callable[..., Any])
+_T = TypeVar("_T")
 
 
 def wrap_coroutine(api: Any, coroutine: _CallableT) -> _CallableT:
@@ -16,3 +19,93 @@ def wrap_coroutine(api: Any, coroutine: _CallableT) -> _CallableT:
         return result
 
     return cast(_CallableT, wrapper)
+
+
+class _AutojumpSelector(selectors.DefaultSelector):
+    """
+    Jumps the frozen time to the next timer instead of blocking, when there is nothing else to wait for until then.
+    The event loop asks it to wait until its next timer is due, so that timer is ready as soon as this returns.
+
+    Executor jobs finish on their own time, so while any of them run the frozen time follows the real time instead,
+    and timeouts on them take as long as they would without a frozen time. File objects the loop waits on
+    get ``io_grace_period`` real seconds to become ready before the jump.
+    """
+
+    io_grace_period = 0.05
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.pending_executor_jobs = 0
+        self.loop_keys = 0
+
+    def select(self, timeout: Optional[float]=None) -> List[Tuple[selectors.SelectorKey, int]]:
+        from . import api
+
+        if timeout is None or timeout <= 0 or not api.freeze_factories:
+            return super().select(timeout)
+
+        if self.pending_executor_jobs:
+            start = api.real_monotonic_ns()
+            events = super().select(timeout)
+            elapsed = api.real_monotonic_ns() - start
+            # A ticking freeze already moved on by itself
+            if elapsed > 0 and not api.tick_flags[-1]:
+                api.freeze_factories[-1].tick(elapsed / 1000000000)
+            return events
+
+        if len(self.get_map()) > self.loop_keys:
+            events = super().select(min(timeout, self.io_grace_period))
+        else:
+            events = super().select(0)
+        if not events:
+            api.freeze_factories[-1].tick(timeout)
+        return events
+
+
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    """
+    An event loop that runs on the frozen time while time is frozen, instead of the real monotonic time.
+    When all that is left to do is wait for a timer, the frozen time jumps ahead to it, so ``asyncio.sleep()``,
+    ``call_later()`` and timeouts return right away, in the order their times would have come.
+    """
+
+    def __init__(self) -> None:
+        selector = _AutojumpSelector()
+        super().__init__(selector)
+        self._autojump_selector = selector
+        # The loop registers its own wakeup pipe, that one doesn't stand for any outstanding I/O
+        selector.loop_keys = len(selector.get_map())
+        # The clock the loop follows, None for the real monotonic one, where that clock stood in nanoseconds
+        # when the loop time got anchored to it, and the loop time it handed out last
+        self._clock: Optional[Any] = None
+        self._clock_origin_ns = 0
+        self._time_at_origin = 0.0
+        self._last_time = 0.0
+
+    def time(self) -> float:
+        from . import api
+
+        clock = api.freeze_factories[-1] if api.freeze_factories else None
+        ns = api.real_monotonic_ns() if clock is None else clock.time_ns()
+        if clock is not self._clock:
+            # When a freeze starts or stops, the loop time carries on from where it stands instead of jumping
+            # between the monotonic and the frozen time, so timers scheduled before keep their place.
+            # Counting from the anchor also keeps the float small enough to tell a timer that is due
+            # from one that is a nanosecond away
+            if self._clock is None:
+                self._time_at_origin += (api.real_monotonic_ns() - self._clock_origin_ns) / 1000000000
+            else:
+                self._time_at_origin = self._last_time
+            self._clock = clock
+            self._clock_origin_ns = ns
+        self._last_time = self._time_at_origin + (ns - self._clock_origin_ns) / 1000000000
+        return self._last_time
+
+    def run_in_executor(self, executor: Any, func: Callable[..., _T], *args: Any) -> "asyncio.Future[_T]":  # type: ignore[override]
+        future = super().run_in_executor(executor, func, *args)
+        self._autojump_selector.pending_executor_jobs += 1
+        future.add_done_callback(self._executor_job_done)
+        return future
+
+    def _executor_job_done(self, future: "asyncio.Future[Any]") -> None:
+        self._autojump_selector.pending_executor_jobs -= 1
@@ -4,19 +4,25 @@ import asyncio
 import copyreg
 import dateutil
 import datetime
+import fnmatch
 import functools
+import importlib.abc
+import importlib.machinery
 import sys
+import threading
 import time
 import uuid
 import calendar
+import contextvars
 import unittest
 import platform
 import warnings
 import types
+import weakref
 import numbers
 import inspect
 from typing import TYPE_CHECKING, overload
-from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Set, Type, TypeVar, Tuple, Union
+from typing import Any, Awaitable, Callable, Collection, Dict, Iterator, List, Optional, Sequence, Set, Type, TypeVar, Tuple, Union
 
 from dateutil import parser
 from dateutil.tz import tzlocal
@@ -26,6 +32,12 @@ try:
 except ImportError:
     MayaDT = None
 
+try:
+    import zoneinfo
+except ImportError:
+    # Python 3.8, time zones are looked up with dateutil instead
+    zoneinfo = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from typing_extensions import ParamSpec
 
@@ -48,9 +60,10 @@ real_gmtime = time.gmtime
 real_monotonic = time.monotonic
 real_perf_counter = time.perf_counter
 real_strftime = time.strftime
+real_sleep = time.sleep
 real_date = datetime.date
 real_datetime = datetime.datetime
-real_date_objects = [real_time, real_localtime, real_gmtime, real_monotonic, real_perf_counter, real_strftime, real_date, real_datetime]
+real_date_objects = [real_time, real_localtime, real_gmtime, real_monotonic, real_perf_counter, real_strftime, real_sleep, real_date, real_datetime]
 
 if _TIME_NS_PRESENT:
     real_time_ns = time.time_ns
@@ -64,15 +77,18 @@ if _PERF_COUNTER_NS_PRESENT:
     real_perf_counter_ns = time.perf_counter_ns
     real_date_objects.append(real_perf_counter_ns)
 
-_real_time_object_ids = {id(obj) for obj in real_date_objects}
-
 # time.clock is deprecated and was removed in Python 3.8
 real_clock = getattr(time, 'clock', None)
 
 freeze_factories: List[Union["StepTickTimeFactory", "TickingDateTimeFactory", "FrozenDateTimeFactory"]] = []
 tz_offsets: List[datetime.timedelta] = []
+tz_zones: List[Optional[datetime.tzinfo]] = []
+# per freeze level: its time zone or the tzoffset of its tz_offset, with the local timezone it saw last and its tzlocal, built when first needed
+tz_infos: List[Tuple[datetime.tzinfo, Optional[Tuple[int, int, int]], Optional[datetime.tzinfo]]] = []
 ignore_lists: List[Tuple[str, ...]] = []
+ignore_thread_lists: List[Tuple[Union[threading.Thread, int, str], ...]] = []
 tick_flags: List[bool] = []
+instant_sleep_flags: List[bool] = []
 
 try:
     # noinspection PyUnresolvedReferences
@@ -97,11 +113,164 @@ except (AttributeError, ImportError):
     real_uuid_create = None
 
 
-# keep a cache of module attributes otherwise freezegun will need to analyze too many modules all the time
-_GLOBAL_MODULES_CACHE: Dict[str, Tuple[str, List[Tuple[str, Any]]]] = {}
+# keep a cache of module attributes otherwise freezegun will need to analyze too many modules all the time:
+# module name -> (weak reference to the module, fingerprint, (attribute name, real time object) for its time attributes)
+_GLOBAL_MODULES_CACHE: Dict[str, Tuple[Callable[[], Any], Any, Tuple[Tuple[str, Any], ...]]] = {}
+
+# reverse index of the cache: id of a real time object -> (module name, attribute name) of every place holding it
+_time_object_sites: Dict[int, Set[Tuple[str, str]]] = {}
+
+# ids of the modules in sys.modules the last time we went through it, and the names of those that still need to be analyzed.
+# Neither keeps a module alive, so modules that get removed and garbage collected are not held on to.
+_seen_modules: Dict[str, int] = {}
+_modules_to_analyze: Set[str] = set()
+
+# names of patchable modules that were out of scope the last time they were looked at, by that (ignore, patch_only) scope.
+# Freezes with the same scope leave them be, another scope takes them over once.
+_parked_modules: Dict[Tuple[Tuple[str, ...], Optional[Tuple[str, ...]]], Set[str]] = {}
+
+# names of the modules that got imported since the last time we went through sys.modules
+_imported_module_names: List[str] = []
+
+# names of cached modules that got garbage collected since the last time we went through sys.modules
+_collected_module_names: List[str] = []
+
+# reference counts of the time objects right after the cache was last brought up to date, by (ignore, patch_only) scope
+_checked_time_object_refcounts: Dict[Tuple[Tuple[str, ...], Optional[Tuple[str, ...]]], Optional[Tuple[int, ...]]] = {}
+
+# held while the cache gets updated, so ``warmup(background=True)`` can run next to the first freeze
+_module_cache_lock = threading.RLock()
+
+
+# whether the fakes stay in place for good, see ``configure(rebind_on_import=True)``
+_rebinding_active = False
+
+# names of the modules the import recorder is currently looking up through the other finders, per thread
+_import_hook_lookups = threading.local()
+
+# (module, attribute name, real time object) for every fake a module imported while time was frozen,
+# and the names of those modules, so stop() can put the real time objects back without analyzing them
+_frozen_import_changes: List[Tuple[Any, str, Any]] = []
+_frozen_import_names: Set[str] = set()
+
+
+class _ModuleImportRecorder(importlib.abc.MetaPathFinder):
+    """
+    Records the name of every module that gets imported, so that ``start()`` only has to
+    analyze new modules instead of everything in ``sys.modules``.
+    It never finds a module itself and leaves the actual import to the other finders.
+    While time is frozen or rebinding is active, it wraps the loader they come up with,
+    to deal with the time objects the module imported right after it ran.
+    """
+
+    def find_spec(self, fullname: str, path: Optional[Sequence[str]], target: Optional[types.ModuleType]=None) -> Optional[importlib.machinery.ModuleSpec]:
+        _imported_module_names.append(fullname)
+        if not _rebinding_active and not freeze_factories:
+            return None
+
+        in_progress = _import_hook_lookups.__dict__.setdefault('names', set())
+        if fullname in in_progress:
+            return None
+        in_progress.add(fullname)
+        try:
+            spec = self._find_spec_after_recorder(fullname, path, target)
+        finally:
+            in_progress.discard(fullname)
+
+        if spec is None or not hasattr(spec.loader, 'exec_module'):
+            return spec
+        spec.loader = _ImportHookLoader(fullname, spec.loader)
+        return spec
+
+    def _find_spec_after_recorder(self, fullname: str, path: Optional[Sequence[str]], target: Optional[types.ModuleType]) -> Optional[importlib.machinery.ModuleSpec]:
+        meta_path = list(sys.meta_path)
+        position = meta_path.index(self) + 1 if self in meta_path else 0
+        for finder in meta_path[position:]:
+            find_spec = getattr(finder, 'find_spec', None)
+            if find_spec is None:
+                # A legacy finder, leave the whole lookup to the import system
+                return None
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                return spec  # type: ignore[no-any-return]
+        return None
+
+
+class _ImportHookLoader(importlib.abc.Loader):
+    """
+    Runs a module through its original loader, then hands it to ``_module_executed()``.
+    """
+
+    def __init__(self, fullname: str, loader: Any) -> None:
+        self.fullname = fullname
+        self.loader = loader
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.loader, name)
+
+    def create_module(self, spec: importlib.machinery.ModuleSpec) -> Optional[types.ModuleType]:
+        create_module = getattr(self.loader, 'create_module', None)
+        if create_module is None:
+            return None
+        return create_module(spec)  # type: ignore[no-any-return]
 
+    def exec_module(self, module: types.ModuleType) -> None:
+        # Anyone looking at the module later on should only ever see the original loader
+        if getattr(module, '__loader__', None) is self:
+            module.__loader__ = self.loader
+        spec = getattr(module, '__spec__', None)
+        if spec is not None and spec.loader is self:
+            spec.loader = self.loader
+
+        self.loader.exec_module(module)
+        _module_executed(self.fullname, sys.modules.get(self.fullname, module))
+
+
+_module_import_recorder = _ModuleImportRecorder()
+
+
+class _ModuleRef(weakref.ref):  # type: ignore[type-arg]
+    """A weak reference to a cached module, which knows the name to evict once the module is gone"""
+
+    __slots__ = ('mod_name',)
+    mod_name: str
+
+
+def _module_collected(module_ref: _ModuleRef) -> None:
+    # Runs in the middle of garbage collection, so only take note and leave the cleanup to _update_seen_modules()
+    _collected_module_names.append(module_ref.mod_name)
+
+
+def _get_module_ref(mod_name: str, module: Any) -> Callable[[], Any]:
+    """Returns a weak reference to the module, or a strong one for the odd object in sys.modules that does not support those"""
+    try:
+        module_ref = _ModuleRef(module, _module_collected)
+    except TypeError:
+        return lambda: module
+    module_ref.mod_name = mod_name
+    return module_ref
+
+
+def _get_module_dict(module: Any) -> Optional[Dict[str, Any]]:
+    """
+    Returns the namespace of a real module without going through ``__getattr__`` or ``__getattribute__``,
+    so lazy modules don't get loaded. Anything else that lives in ``sys.modules`` has no such namespace.
+    """
+    if isinstance(module, types.ModuleType):
+        return object.__getattribute__(module, '__dict__')  # type: ignore[no-any-return]
+    return None
+
+
+def _is_scanned_with_getattr(mod_name: str, module: Any) -> bool:
+    """Whether the module can only be analyzed through ``dir()`` and ``getattr()``, which might run any code"""
+    return _get_module_dict(module) is None or mod_name.startswith(tuple(config.settings.scan_with_getattr))
+
+
+def _get_module_attributes(mod_name: str, module: types.ModuleType) -> List[Tuple[str, Any]]:
+    module_dict = _get_module_dict(module)
+    if module_dict is not None and not _is_scanned_with_getattr(mod_name, module):
+        return list(module_dict.items())
 
-def _get_module_attributes(module: types.ModuleType) -> List[Tuple[str, Any]]:
     result: List[Tuple[str, Any]] = []
     try:
         module_attributes = dir(module)
@@ -118,33 +287,344 @@ def _get_module_attributes(module: types.ModuleType) -> List[Tuple[str, Any]]:
     return result
 
 
-def _setup_module_cache(module: types.ModuleType) -> None:
-    date_attrs = []
-    all_module_attributes = _get_module_attributes(module)
-    for attribute_name, attribute_value in all_module_attributes:
-        if id(attribute_value) in _real_time_object_ids:
-            date_attrs.append((attribute_name, attribute_value))
-    _GLOBAL_MODULES_CACHE[module.__name__] = (_get_module_attributes_hash(module), date_attrs)
-
-
-def _get_module_attributes_hash(module: types.ModuleType) -> str:
+def _get_module_fingerprint(module: Any) -> Any:
+    """
+    A cheap value that changes whenever names get added to or removed from a module,
+    e.g. because it ran ``from time import time`` after it was analyzed.
+    Real modules get away with the size of their ``__dict__`` and a hash of its keys, which also tells
+    a name that replaced another one apart. Anything else is hashed through ``dir()``.
+    """
+    module_dict = _get_module_dict(module)
+    if module_dict is not None:
+        return len(module_dict), hash(tuple(module_dict))
     try:
         module_dir = dir(module)
     except (ImportError, TypeError):
         module_dir = []
-    return f'{id(module)}-{hash(frozenset(module_dir))}'
+    return hash(frozenset(module_dir))
+
+
+def _setup_module_cache(mod_name: str, module: Any) -> None:
+    fingerprint = _get_module_fingerprint(module)
+    date_attrs = []
+    module_dict = _get_module_dict(module)
+    if (module_dict is not None and not _is_scanned_with_getattr(mod_name, module)
+            and _time_object_ids.isdisjoint(map(id, module_dict.values()))):
+        # Most modules never import a time function, comparing ids at C speed rules those out
+        all_module_attributes = []
+    else:
+        all_module_attributes = _get_module_attributes(mod_name, module)
+    for attribute_name, attribute_value in all_module_attributes:
+        # Modules imported while time is frozen hold on to the fakes, so look for those as well
+        real = _time_object_reals.get(id(attribute_value))
+        if real is not None:
+            date_attrs.append((attribute_name, real))
+    for attribute_name, real in date_attrs:
+        _time_object_sites.setdefault(id(real), set()).add((mod_name, attribute_name))
+    _GLOBAL_MODULES_CACHE[mod_name] = (_get_module_ref(mod_name, module), fingerprint, tuple(date_attrs))
 
 
-def _get_cached_module_attributes(module: types.ModuleType) -> List[Tuple[str, Any]]:
-    module_hash, cached_attrs = _GLOBAL_MODULES_CACHE.get(module.__name__, ('0', []))
-    if _get_module_attributes_hash(module) == module_hash:
-        return cached_attrs
+def _forget_module(mod_name: str) -> None:
+    _modules_to_analyze.discard(mod_name)
+    for parked_names in _parked_modules.values():
+        parked_names.discard(mod_name)
+    _module_ref, _fingerprint, date_attrs = _GLOBAL_MODULES_CACHE.pop(mod_name, (None, None, ()))
+    for attribute_name, real in date_attrs:
+        _time_object_sites[id(real)].discard((mod_name, attribute_name))
 
-    # cache miss: update the cache and return the refreshed value
-    _setup_module_cache(module)
-    # return the newly cached value
-    module_hash, cached_attrs = _GLOBAL_MODULES_CACHE[module.__name__]
-    return cached_attrs
+
+def _module_changed(mod_name: str, module: Any) -> None:
+    _forget_module(mod_name)
+    _seen_modules[mod_name] = id(module)
+    _modules_to_analyze.add(mod_name)
+
+
+def _update_seen_modules(check_all: bool=True) -> Set[str]:
+    """
+    Brings ``_seen_modules`` in line with ``sys.modules``, queueing new or replaced modules for analysis.
+    Returns the names it queued.
+    Normally the import recorder tells us exactly which modules are new. Anything else, like modules
+    that were removed or put into ``sys.modules`` by hand, is picked up by comparing the ids of the modules.
+    Those ids can only be reused once a module got garbage collected, which its weak reference reports.
+    Without ``check_all`` the ids are only compared when the number of modules changed, as a module
+    replaced by hand only matters if it holds a time object, see ``_time_objects_rebound()``.
+    """
+    if _module_import_recorder not in sys.meta_path:
+        sys.meta_path.insert(0, _module_import_recorder)
+
+    changed = set()
+    while _collected_module_names:
+        mod_name = _collected_module_names.pop()
+        module_ref = _GLOBAL_MODULES_CACHE.get(mod_name, (None,))[0]
+        if module_ref is not None and module_ref() is None:
+            _forget_module(mod_name)
+            _seen_modules.pop(mod_name, None)
+
+    while _imported_module_names:
+        mod_name = _imported_module_names.pop()
+        module = sys.modules.get(mod_name)
+        if module is not None and _seen_modules.get(mod_name) != id(module):
+            _module_changed(mod_name, module)
+            changed.add(mod_name)
+
+    if not check_all and len(sys.modules) == len(_seen_modules):
+        return changed
+
+    modules = sys.modules.copy()
+    current_modules = dict(zip(modules, map(id, modules.values())))
+    if current_modules == _seen_modules:
+        return changed
+
+    for mod_name in list(_seen_modules):
+        if mod_name not in current_modules:
+            del _seen_modules[mod_name]
+            _forget_module(mod_name)
+    for mod_name, module_id in current_modules.items():
+        if _seen_modules.get(mod_name) != module_id:
+            _module_changed(mod_name, modules[mod_name])
+            changed.add(mod_name)
+    return changed
+
+
+def _is_patchable_module(mod_name: str, module: Any) -> bool:
+    if mod_name is None or module is None or mod_name == __name__:
+        return False
+    elif mod_name.endswith('.six.moves'):
+        return False
+    module_dict = _get_module_dict(module)
+    if module_dict is not None:
+        module_name = module_dict.get('__name__')
+    else:
+        module_name = getattr(module, '__name__', None)
+    return module_name is not None and module_name not in ('datetime', 'time')
+
+
+def _is_module_in_scope(mod_name: str, ignore: Tuple[str, ...], patch_only: Optional[Tuple[str, ...]]) -> bool:
+    if patch_only is not None and not mod_name.startswith(patch_only):
+        return False
+    return not mod_name.startswith(ignore)
+
+
+def _update_module_cache(ignore: Tuple[str, ...], patch_only: Optional[Tuple[str, ...]]=None, defer_getattr_scans: bool=False) -> List[str]:
+    """
+    Analyzes every module that was imported or changed since the last call, and is not ignored or
+    outside of ``patch_only``. The results end up in ``_GLOBAL_MODULES_CACHE`` and ``_time_object_sites``.
+    With ``defer_getattr_scans``, modules that need ``dir()`` and ``getattr()`` are left for a later call.
+    Returns the names of the modules it analyzed.
+    """
+    with _module_cache_lock:
+        scope = (ignore, patch_only)
+        # Only go through every cached module when one of them might have bound a time object since the last time
+        check_all = _time_objects_rebound(scope)
+        _update_seen_modules(check_all)
+
+        if check_all:
+            for mod_name, (module_ref, fingerprint, _date_attrs) in list(_GLOBAL_MODULES_CACHE.items()):
+                if patch_only is not None and not mod_name.startswith(patch_only):
+                    continue
+                module = module_ref()
+                if module is not None and _get_module_fingerprint(module) != fingerprint:
+                    _module_changed(mod_name, module)
+
+        # Names parked by freezes with another scope are looked at once more, and move over to this one
+        for other_scope in [other_scope for other_scope in _parked_modules if other_scope != scope]:
+            _modules_to_analyze.update(_parked_modules.pop(other_scope))
+
+        queued = [mod_name for mod_name in _modules_to_analyze
+                  if not (defer_getattr_scans and _is_scanned_with_getattr(mod_name, sys.modules.get(mod_name)))]
+        analyzed = _analyze_queued_modules(queued, ignore, patch_only)
+        # The cache holds references of its own, so only count once it is done
+        _checked_time_object_refcounts[scope] = _get_time_object_refcounts()
+        return analyzed
+
+
+def _get_time_object_refcounts() -> Optional[Tuple[int, ...]]:
+    """
+    The reference counts of the real time objects and their fakes. Binding one of them anywhere, like
+    ``module.now = time.time``, changes those, so they tell whether the cached modules need another look.
+    None where the counts can't be relied on, e.g. on PyPy or for immortal objects.
+    """
+    if not _time_object_refcounts_usable:
+        return None
+    return tuple(map(sys.getrefcount, _time_objects))
+
+
+def _time_objects_rebound(scope: Tuple[Tuple[str, ...], Optional[Tuple[str, ...]]]) -> bool:
+    """Whether a module might have bound a time object since the cache was last brought up to date for ``scope``"""
+    refcounts = _get_time_object_refcounts()
+    return refcounts is None or refcounts != _checked_time_object_refcounts.get(scope)
+
+
+def _analyze_queued_modules(mod_names: Collection[str], ignore: Tuple[str, ...], patch_only: Optional[Tuple[str, ...]]) -> List[str]:
+    """
+    Analyzes the given queued modules that are in scope, and parks the rest under the scope.
+    Returns the names of the modules it analyzed. Must be called with ``_module_cache_lock`` held.
+    """
+    analyzed = []
+    parked = _parked_modules.setdefault((ignore, patch_only), set())
+    for mod_name in mod_names:
+        _modules_to_analyze.discard(mod_name)
+        module = sys.modules.get(mod_name)
+        if not _is_patchable_module(mod_name, module):
+            continue
+        if _is_module_in_scope(mod_name, ignore, patch_only):
+            _setup_module_cache(mod_name, module)
+            analyzed.append(mod_name)
+        else:
+            # Parked rather than dropped, in case a later freeze does want them
+            parked.add(mod_name)
+    return analyzed
+
+
+def _get_time_object_sites(real: Any, ignore: Tuple[str, ...], patch_only: Optional[Tuple[str, ...]]=None) -> Iterator[Tuple[types.ModuleType, str]]:
+    """Yields every (module, attribute name) holding ``real`` or its fake, skipping modules that are out of scope"""
+    for mod_name, attribute_name in list(_time_object_sites.get(id(real), ())):
+        if _is_module_in_scope(mod_name, ignore, patch_only):
+            module = _GLOBAL_MODULES_CACHE[mod_name][0]()
+            if module is not None:
+                yield module, attribute_name
+
+
+def _get_default_scope() -> Tuple[Tuple[str, ...], Optional[Tuple[str, ...]]]:
+    """The modules the defaults from the config cover, for everything that is not tied to a single ``freeze_time()``"""
+    patch_only = config.settings.default_patch_only
+    return tuple(config.settings.default_ignore_list), tuple(patch_only) if patch_only is not None else None
+
+
+def _module_executed(mod_name: str, module: Any) -> None:
+    if _rebinding_active:
+        _rebind_module(mod_name, module)
+    elif freeze_factories and not _fakes_installed:
+        _record_frozen_import(mod_name, module)
+
+
+def _record_frozen_import(mod_name: str, module: Any) -> None:
+    """Notes the fakes a module imported while time is frozen, for stop() to swap back"""
+    module_dict = _get_module_dict(module)
+    if module_dict is None or not _is_patchable_module(mod_name, module):
+        return
+    _frozen_import_names.add(mod_name)
+    if _time_object_ids.isdisjoint(map(id, module_dict.values())):
+        return
+    for attribute_name, attribute_value in list(module_dict.items()):
+        real = _time_object_reals.get(id(attribute_value))
+        if real is not None and attribute_value is not real and attribute_name not in _time_object_fake_names:
+            _frozen_import_changes.append((module, attribute_name, real))
+
+
+def _restore_frozen_imports() -> None:
+    """Swaps the fakes back for the real time objects in the modules imported while time was frozen"""
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+
+        while _frozen_import_changes:
+            module, attribute_name, real = _frozen_import_changes.pop()
+            if getattr(module, attribute_name, None) is _time_object_fakes_by_real_id[id(real)]:
+                setattr(module, attribute_name, real)
+    _frozen_import_names.clear()
+
+
+def _restore_analyzed_modules(mod_names: List[str]) -> None:
+    """Swaps the fakes back for the real time objects in the given modules, which were just analyzed"""
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+
+        for mod_name in mod_names:
+            module_ref, _fingerprint, date_attrs = _GLOBAL_MODULES_CACHE[mod_name]
+            module = module_ref()
+            for attribute_name, real in date_attrs:
+                if attribute_name in _time_object_fake_names:
+                    continue
+                if getattr(module, attribute_name, None) is _time_object_fakes_by_real_id[id(real)]:
+                    setattr(module, attribute_name, real)
+
+
+def _rebind_module(mod_name: str, module: Any) -> None:
+    """Swaps every real time object a freshly imported module holds for its fake"""
+    ignore, patch_only = _get_default_scope()
+    if not _is_patchable_module(mod_name, module) or not _is_module_in_scope(mod_name, ignore, patch_only):
+        return
+    module_dict = _get_module_dict(module)
+    if module_dict is None:
+        return
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore')
+
+        for attribute_name, attribute_value in list(module_dict.items()):
+            fake = _time_object_fakes_by_real_id.get(id(attribute_value))
+            if fake is not None and fake is not fake_sleep and attribute_name not in _time_object_fake_names:
+                module_dict[attribute_name] = fake
+
+
+def _restore_time_object_sites(ignore: Tuple[str, ...], patch_only: Optional[Tuple[str, ...]]) -> None:
+    """Swaps the fakes back for the real time objects, wherever a module in scope still holds one"""
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+
+        _update_module_cache(ignore, patch_only)
+        for real, fake in _time_object_fakes:
+            for module, attribute_name in _get_time_object_sites(real, ignore, patch_only):
+                if attribute_name in _time_object_fake_names:
+                    continue
+                if getattr(module, attribute_name, None) is fake:
+                    setattr(module, attribute_name, real)
+
+
+def _rebind_time_object_sites(ignore: Tuple[str, ...], patch_only: Optional[Tuple[str, ...]]) -> None:
+    """Swaps the real time objects for the fakes, wherever a module in scope holds one"""
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore')
+
+        _update_module_cache(ignore, patch_only)
+        for real, fake in _time_object_fakes:
+            if real is real_sleep:
+                # Left to the freezes with instant_sleep, see _update_time_sleep()
+                continue
+            for module, attribute_name in _get_time_object_sites(real, ignore, patch_only):
+                if getattr(module, attribute_name, None) is real:
+                    setattr(module, attribute_name, fake)
+
+
+def _update_rebinding() -> None:
+    """
+    Switches rebinding on or off, following ``config.settings.rebind_on_import``.
+    Switching it on swaps the real time objects for the fakes in every module imported so far,
+    the import recorder takes care of the modules imported afterwards.
+    """
+    global _rebinding_active
+
+    if config.settings.rebind_on_import == _rebinding_active:
+        return
+    ignore, patch_only = _get_default_scope()
+
+    if not config.settings.rebind_on_import:
+        _rebinding_active = False
+        _restore_time_object_sites(ignore, patch_only)
+        return
+
+    _rebind_time_object_sites(ignore, patch_only)
+    _rebinding_active = True
+
+
+def warmup(background: bool=False) -> Optional[threading.Thread]:
+    """
+    Analyzes the loaded modules ahead of time, so the first ``freeze_time()`` is as fast as the ones after it.
+    With ``background=True`` this happens in a daemon thread, which is returned. A freeze starting in
+    the meantime waits for it to finish. ``warnings.catch_warnings()`` is not thread-safe, so the thread
+    leaves the modules that need ``dir()`` and ``getattr()``, which might warn, to the next call.
+    """
+    if background:
+        thread = threading.Thread(target=_update_module_cache, args=_get_default_scope(), kwargs={'defer_getattr_scans': True},
+                                  name='freezegun-warmup', daemon=True)
+        thread.start()
+        return thread
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore')
+
+        _update_module_cache(*_get_default_scope())
+    return None
 
 
 _is_cpython = (
@@ -155,24 +635,145 @@ _is_cpython = (
 
 call_stack_inspection_limit = 5
 
+# set within ``use_real_time()``, where the fakes hand out the real time no matter what is frozen
+_real_time_requested: "contextvars.ContextVar[bool]" = contextvars.ContextVar('freezegun_real_time_requested', default=False)
 
-def _should_use_real_time() -> bool:
-    if not call_stack_inspection_limit:
+
+class use_real_time:
+    """
+    A context manager and decorator within which the fakes hand out the real time, even while time is frozen.
+    Unlike ignoring modules this does not look at the call stack, and carries over to asyncio tasks created within.
+    """
+
+    def __init__(self) -> None:
+        self._tokens: List["contextvars.Token[bool]"] = []
+
+    def __enter__(self) -> None:
+        self._tokens.append(_real_time_requested.set(True))
+
+    def __exit__(self, *args: Any) -> None:
+        _real_time_requested.reset(self._tokens.pop())
+
+    def __call__(self, func: "Callable[P, T]") -> "Callable[P, T]":
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: "P.args", **kwargs: "P.kwargs") -> Any:
+                token = _real_time_requested.set(True)
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    _real_time_requested.reset(token)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: "P.args", **kwargs: "P.kwargs") -> T:
+            token = _real_time_requested.set(True)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _real_time_requested.reset(token)
+
+        return wrapper
+
+
+def _is_time_frozen() -> bool:
+    """Whether the fakes hand out the frozen time, leaving ignored modules and threads aside"""
+    return bool(freeze_factories) and not _real_time_requested.get()
+
+
+def _is_time_frozen_for_caller() -> bool:
+    """
+    Like ``_is_time_frozen()``, for the fake classes. A freeze normally leaves ignored modules with the real classes,
+    but while the fakes stay in place between freezes (see ``install_fakes()`` and ``rebind_on_import``) every module
+    holds the fake ones, so those look at the ignore list like the fake functions do.
+    """
+    if not _is_time_frozen():
         return False
+    return not ((_fakes_installed or _rebinding_active) and _should_use_real_time())
+
+
+def _get_tzlocal() -> datetime.tzinfo:
+    """
+    Returns a ``tzlocal()`` that is shared within the innermost freeze, instead of building one for every call.
+    It is built again when ``time.tzset()`` changed the local timezone in the meantime.
+    """
+    if not tz_infos:
+        return tzlocal()
+    if tz_zones[-1] is not None:
+        return tz_zones[-1]
+    offset_tz, local_key, local_tz = tz_infos[-1]
+    current_key = (time.timezone, time.altzone, time.daylight)
+    if local_tz is None or local_key != current_key:
+        local_tz = tzlocal()
+        tz_infos[-1] = (offset_tz, current_key, local_tz)
+    return local_tz
+
+
+# the ignore list of the innermost freeze, with whether it ignores a module, for every module name looked up so far
+_ignore_decisions: Tuple[Tuple[str, ...], Dict[str, bool]] = ((), {})
+
+# per thread: the ignored threads of the innermost freeze, with whether they include the thread
+_thread_ignore_decisions = threading.local()
+
+
+def _is_current_thread_ignored(ignore_threads: Tuple[Union[threading.Thread, int, str], ...]) -> bool:
+    """
+    Tells whether the current thread is one of ``ignore_threads``: the thread itself, its ident or a pattern for its name.
+    This is only worked out once per thread and freeze.
+    """
+    decision = getattr(_thread_ignore_decisions, 'decision', None)
+    if decision is not None and decision[0] is ignore_threads:
+        return decision[1]  # type: ignore[no-any-return]
+
+    thread = threading.current_thread()
+    ignored = False
+    for ignore_thread in ignore_threads:
+        if isinstance(ignore_thread, str):
+            ignored = fnmatch.fnmatchcase(thread.name, ignore_thread)
+        elif isinstance(ignore_thread, int):
+            ignored = ignore_thread == thread.ident
+        else:
+            ignored = ignore_thread is thread
+        if ignored:
+            break
+    _thread_ignore_decisions.decision = (ignore_threads, ignored)
+    return ignored
+
+
+def _should_use_real_time() -> bool:
+    global _ignore_decisions
 
     # Means stop() has already been called, so we can now return the real time
-    if not ignore_lists:
+    if not ignore_lists or _real_time_requested.get():
+        return True
+
+    ignore_threads = ignore_thread_lists[-1]
+    if ignore_threads and _is_current_thread_ignored(ignore_threads):
         return True
 
-    if not ignore_lists[-1]:
+    if not call_stack_inspection_limit:
+        return False
+
+    ignore = ignore_lists[-1]
+    if not ignore:
         return False
 
-    frame = inspect.currentframe().f_back.f_back  # type: ignore
+    decisions_ignore, decisions = _ignore_decisions
+    if decisions_ignore is not ignore and decisions_ignore != ignore:
+        decisions = {}
+        _ignore_decisions = (ignore, decisions)
+
+    frame = sys._getframe(2)
 
     for _ in range(call_stack_inspection_limit):
-        module_name = frame.f_globals.get('__name__')  # type: ignore
-        if module_name and module_name.startswith(ignore_lists[-1]):
-            return True
+        module_name = frame.f_globals.get('__name__')
+        if module_name:
+            ignored = decisions.get(module_name)
+            if ignored is None:
+                ignored = decisions[module_name] = module_name.startswith(ignore)
+            if ignored:
+                return True
 
         frame = frame.f_back  # type: ignore
         if frame is None:
@@ -185,17 +786,82 @@ def get_current_time() -> datetime.datetime:
     return freeze_factories[-1]()
 
 
+def get_current_time_ns() -> int:
+    return freeze_factories[-1].time_ns()
+
+
+# the frozen instant the last derived values were worked out for, with those values
+_instant_values: Tuple[Optional[datetime.datetime], Dict[Any, Any]] = (None, {})
+
+
+def _get_instant_values(current_time: datetime.datetime) -> Dict[Any, Any]:
+    """
+    Returns a dict to keep values derived from ``current_time`` in, like its epoch or ``struct_time``.
+    It stays the same for as long as the frozen instant does, so those only get worked out once.
+    """
+    global _instant_values
+
+    instant, values = _instant_values
+    if instant is not current_time and (instant != current_time or instant.tzinfo is not current_time.tzinfo):  # type: ignore[union-attr]
+        values = {}
+        _instant_values = (current_time, values)
+    return values
+
+
+def _get_local_offset(current_time: datetime.datetime) -> datetime.timedelta:
+    """
+    Returns the offset of the local time from ``current_time``, the frozen time in UTC.
+    It comes from the time zone of the innermost freeze when it has one, and from its ``tz_offset`` otherwise.
+    """
+    zone = tz_zones[-1]
+    if zone is None:
+        return tz_offsets[-1]
+    # Not every tzinfo is hashable, so they go by id, and keep the zone to rule out a reused id
+    values = _get_instant_values(current_time)
+    key = ('utcoffset', id(zone))
+    cached = values.get(key)
+    if cached is None or cached[0] is not zone:
+        cached = values[key] = (zone, zone.fromutc(current_time.replace(tzinfo=zone)).utcoffset())
+    return cached[1]  # type: ignore[return-value]
+
+
+def _datetime_to_ns(value: datetime.datetime) -> int:
+    """Returns the nanoseconds between the epoch and a naive UTC datetime"""
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1000000000 + delta.microseconds * 1000
+
+
+def _ns_to_datetime(ns: int) -> datetime.datetime:
+    return _EPOCH + datetime.timedelta(microseconds=ns // 1000)
+
+
+def _delta_to_ns(delta: Union[datetime.timedelta, float]) -> int:
+    if isinstance(delta, numbers.Integral):
+        return int(delta) * 1000000000
+    elif isinstance(delta, numbers.Real):
+        return round(float(delta) * 1e9)
+    return (delta.days * 86400 + delta.seconds) * 1000000000 + delta.microseconds * 1000  # type: ignore[union-attr]
+
+
+def _add_delta_to_ns(ns: int, delta: Union[datetime.timedelta, float]) -> int:
+    """Moves ``ns`` ahead by ``delta``, which can also be a calendar delta like a ``relativedelta``"""
+    if isinstance(delta, (numbers.Real, datetime.timedelta)):
+        return ns + _delta_to_ns(delta)
+    # Only datetime arithmetic knows how long a month is, the nanoseconds below a microsecond are kept as they are
+    return _datetime_to_ns(_ns_to_datetime(ns) + delta) + ns % 1000  # type: ignore[operator]
+
+
 def fake_time() -> float:
     if _should_use_real_time():
         return real_time()
-    current_time = get_current_time()
-    return calendar.timegm(current_time.timetuple()) + current_time.microsecond / 1000000.0
+    # Dividing two ints rounds only once, unlike going through a float of the nanoseconds
+    return get_current_time_ns() / 1000000000
 
 if _TIME_NS_PRESENT:
     def fake_time_ns() -> int:
         if _should_use_real_time():
             return real_time_ns()
-        return int(fake_time() * 1e9)
+        return get_current_time_ns()
 
 
 def fake_localtime(t: Optional[float]=None) -> time.struct_time:
@@ -203,8 +869,21 @@ def fake_localtime(t: Optional[float]=None) -> time.struct_time:
         return real_localtime(t)
     if _should_use_real_time():
         return real_localtime()
-    shifted_time = get_current_time() - datetime.timedelta(seconds=time.timezone)
-    return shifted_time.timetuple()
+    current_time = get_current_time()
+    values = _get_instant_values(current_time)
+    zone = tz_zones[-1]
+    if zone is not None:
+        cached = values.get(('localtime', id(zone)))
+        if cached is None or cached[0] is not zone:
+            cached = values[('localtime', id(zone))] = (zone, zone.fromutc(current_time.replace(tzinfo=zone)).timetuple())
+        return cached[1]  # type: ignore[no-any-return]
+    # time.timezone changes along with time.tzset()
+    key = ('localtime', time.timezone)
+    localtime = values.get(key)
+    if localtime is None:
+        shifted_time = current_time - datetime.timedelta(seconds=time.timezone)
+        localtime = values[key] = shifted_time.timetuple()
+    return localtime  # type: ignore[no-any-return]
 
 
 def fake_gmtime(t: Optional[float]=None) -> time.struct_time:
@@ -212,25 +891,22 @@ def fake_gmtime(t: Optional[float]=None) -> time.struct_time:
         return real_gmtime(t)
     if _should_use_real_time():
         return real_gmtime()
-    return get_current_time().timetuple()
+    current_time = get_current_time()
+    values = _get_instant_values(current_time)
+    gmtime = values.get('gmtime')
+    if gmtime is None:
+        gmtime = values['gmtime'] = current_time.timetuple()
+    return gmtime  # type: ignore[no-any-return]
 
 
 def _get_fake_monotonic() -> float:
     # For monotonic timers like .monotonic(), .perf_counter(), etc
-    current_time = get_current_time()
-    return (
-        calendar.timegm(current_time.timetuple()) +
-        current_time.microsecond / 1e6
-    )
+    return get_current_time_ns() / 1000000000
 
 
 def _get_fake_monotonic_ns() -> int:
     # For monotonic timers like .monotonic(), .perf_counter(), etc
-    current_time = get_current_time()
-    return (
-        calendar.timegm(current_time.timetuple()) * 1000000 +
-        current_time.microsecond
-    ) * 1000
+    return get_current_time_ns()
 
 
 def fake_monotonic() -> float:
@@ -272,6 +948,21 @@ def fake_strftime(format: Any, time_to_format: Any=None) -> str:
     else:
         return real_strftime(format, time_to_format)
 
+# What time.sleep was before the freezes started, like a mock, so that fake_sleep can hand the sleeping back to it
+_sleep_before_freeze = real_sleep
+
+
+def fake_sleep(secs: float) -> None:
+    # Only freezes that asked for it skip the sleep, the others keep blocking
+    if not instant_sleep_flags or not instant_sleep_flags[-1] or _should_use_real_time():
+        return _sleep_before_freeze(secs)
+    if secs < 0:
+        raise ValueError('sleep length must be non-negative')
+    if secs == 0:
+        # A StepTickTimeFactory would take a delta of 0 for its own step width
+        return
+    freeze_factories[-1].tick(secs)
+
 if real_clock is not None:
     def fake_clock() -> Any:
         if _should_use_real_time():
@@ -303,6 +994,8 @@ class FakeDateMeta(type):
 
 
 def datetime_to_fakedatetime(datetime: datetime.datetime) -> "FakeDatetime":
+    if type(datetime) is FakeDatetime:
+        return datetime
     return FakeDatetime(datetime.year,
                         datetime.month,
                         datetime.day,
@@ -314,21 +1007,28 @@ def datetime_to_fakedatetime(datetime: datetime.datetime) -> "FakeDatetime":
 
 
 def date_to_fakedate(date: datetime.date) -> "FakeDate":
+    if type(date) is FakeDate:
+        return date
     return FakeDate(date.year,
                     date.month,
                     date.day)
 
 
 class FakeDate(real_date, metaclass=FakeDateMeta):
+    # Like real dates, fake ones don't need a __dict__ for every instance
+    __slots__ = ()
+
+    # Since Python 3.8 arithmetic on a subclass of date already returns an instance of that subclass,
+    # so the result only needs converting on older versions
     def __add__(self, other: Any) -> "FakeDate":
         result = real_date.__add__(self, other)
-        if result is NotImplemented:
+        if type(result) is FakeDate or result is NotImplemented:
             return result
         return date_to_fakedate(result)
 
     def __sub__(self, other: Any) -> "FakeDate":  # type: ignore
         result = real_date.__sub__(self, other)
-        if result is NotImplemented:
+        if type(result) is FakeDate or result is NotImplemented:
             return result  # type: ignore
         if isinstance(result, real_date):
             return date_to_fakedate(result)
@@ -337,8 +1037,16 @@ class FakeDate(real_date, metaclass=FakeDateMeta):
 
     @classmethod
     def today(cls: Type["FakeDate"]) -> "FakeDate":
-        result = cls._date_to_freeze() + cls._tz_offset()
-        return date_to_fakedate(result)
+        if not _is_time_frozen_for_caller():
+            return date_to_fakedate(real_date.today())
+        now = cls._date_to_freeze()
+        tz_offset = _get_local_offset(now)
+        values = _get_instant_values(now)
+        key = ('today', tz_offset)
+        today = values.get(key)
+        if today is None:
+            today = values[key] = date_to_fakedate(now + tz_offset)
+        return today  # type: ignore[no-any-return]
 
     @staticmethod
     def _date_to_freeze() -> datetime.datetime:
@@ -362,16 +1070,27 @@ class FakeDatetimeMeta(FakeDateMeta):
         return issubclass(subclass, real_datetime)
 
 
+if _is_cpython:
+    # isinstance() calls a check that isn't a descriptor with the object alone, so the checks of
+    # the real classes can stand in for the ones above without running Python code for every call
+    FakeDateMeta.__instancecheck__ = real_date.__instancecheck__  # type: ignore[method-assign,assignment]
+    FakeDateMeta.__subclasscheck__ = real_date.__subclasscheck__  # type: ignore[method-assign,assignment]
+    FakeDatetimeMeta.__instancecheck__ = real_datetime.__instancecheck__  # type: ignore[method-assign,assignment]
+    FakeDatetimeMeta.__subclasscheck__ = real_datetime.__subclasscheck__  # type: ignore[method-assign,assignment]
+
+
 class FakeDatetime(real_datetime, FakeDate, metaclass=FakeDatetimeMeta):
+    __slots__ = ()
+
     def __add__(self, other: Any) -> "FakeDatetime":  # type: ignore
         result = real_datetime.__add__(self, other)
-        if result is NotImplemented:
+        if type(result) is FakeDatetime or result is NotImplemented:
             return result
         return datetime_to_fakedatetime(result)
 
     def __sub__(self, other: Any) -> "FakeDatetime":  # type: ignore
         result = real_datetime.__sub__(self, other)
-        if result is NotImplemented:
+        if type(result) is FakeDatetime or result is NotImplemented:
             return result  # type: ignore
         if isinstance(result, real_datetime):
             return datetime_to_fakedatetime(result)
@@ -380,31 +1099,52 @@ class FakeDatetime(real_datetime, FakeDate, metaclass=FakeDatetimeMeta):
 
     def astimezone(self, tz: Optional[datetime.tzinfo]=None) -> "FakeDatetime":
         if tz is None:
-            tz = tzlocal()
+            tz = _get_tzlocal()
+        if self.tzinfo is None and _is_time_frozen():
+            # A naive value is local time in the frozen zone, not in the zone of the host
+            zone = tz_zones[-1]
+            if zone is not None:
+                return datetime_to_fakedatetime(real_datetime.astimezone(real_datetime.replace(self, tzinfo=zone), tz))
         return datetime_to_fakedatetime(real_datetime.astimezone(self, tz))
 
     @classmethod
     def fromtimestamp(cls, t: float, tz: Optional[datetime.tzinfo]=None) -> "FakeDatetime":
-        if tz is None:
-            tz = dateutil.tz.tzoffset("freezegun", cls._tz_offset())
+        if tz is None and not _is_time_frozen():
+            result = real_datetime.fromtimestamp(t)
+        elif tz is None:
+            tz = tz_infos[-1][0]
             result = real_datetime.fromtimestamp(t, tz=tz).replace(tzinfo=None)
         else:
             result = real_datetime.fromtimestamp(t, tz)
         return datetime_to_fakedatetime(result)
 
     def timestamp(self) -> float:
+        if self.tzinfo is None and not _is_time_frozen():
+            return real_datetime.timestamp(self)
         if self.tzinfo is None:
+            zone = tz_zones[-1]
+            if zone is not None:
+                return real_datetime.timestamp(real_datetime.replace(self, tzinfo=zone))
             return (self - _EPOCH - self._tz_offset()).total_seconds()  # type: ignore
         return (self - _EPOCHTZ).total_seconds()  # type: ignore
 
     @classmethod
     def now(cls, tz: Optional[datetime.tzinfo] = None) -> "FakeDatetime":
-        now = cls._time_to_freeze() or real_datetime.now()
+        now = cls._time_to_freeze()
+        if now is None:
+            return datetime_to_fakedatetime(real_datetime.now(tz))
         if tz:
             result = tz.fromutc(now.replace(tzinfo=tz)) + cls._tz_offset()
-        else:
-            result = now + cls._tz_offset()
-        return datetime_to_fakedatetime(result)
+            return datetime_to_fakedatetime(result)
+
+        # The fakes are immutable, so the frozen instant can hand out the same one every time
+        tz_offset = _get_local_offset(now)
+        values = _get_instant_values(now)
+        key = ('now', tz_offset)
+        fake_now = values.get(key)
+        if fake_now is None:
+            fake_now = values[key] = datetime_to_fakedatetime(now + tz_offset)
+        return fake_now  # type: ignore[no-any-return]
 
     def date(self) -> "FakeDate":
         return date_to_fakedate(self)
@@ -423,12 +1163,12 @@ class FakeDatetime(real_datetime, FakeDate, metaclass=FakeDatetimeMeta):
 
     @classmethod
     def utcnow(cls) -> "FakeDatetime":
-        result = cls._time_to_freeze() or real_datetime.now(datetime.timezone.utc)
+        result = cls._time_to_freeze() or real_datetime.now(datetime.timezone.utc).replace(tzinfo=None)
         return datetime_to_fakedatetime(result)
 
     @staticmethod
     def _time_to_freeze() -> Optional[datetime.datetime]:
-        if freeze_factories:
+        if _is_time_frozen_for_caller():
             return get_current_time()
         return None
 
@@ -440,6 +1180,61 @@ class FakeDatetime(real_datetime, FakeDate, metaclass=FakeDatetimeMeta):
 FakeDatetime.min = datetime_to_fakedatetime(real_datetime.min)
 FakeDatetime.max = datetime_to_fakedatetime(real_datetime.max)
 
+# Every real time object with the fake that replaces it while time is frozen
+_time_object_fakes: List[Tuple[Any, Any]] = [
+    (real_date, FakeDate),
+    (real_datetime, FakeDatetime),
+    (real_gmtime, fake_gmtime),
+    (real_localtime, fake_localtime),
+    (real_monotonic, fake_monotonic),
+    (real_perf_counter, fake_perf_counter),
+    (real_strftime, fake_strftime),
+    (real_time, fake_time),
+    (real_sleep, fake_sleep),
+]
+
+if _TIME_NS_PRESENT:
+    _time_object_fakes.append((real_time_ns, fake_time_ns))
+
+if _MONOTONIC_NS_PRESENT:
+    _time_object_fakes.append((real_monotonic_ns, fake_monotonic_ns))
+
+if _PERF_COUNTER_NS_PRESENT:
+    _time_object_fakes.append((real_perf_counter_ns, fake_perf_counter_ns))
+
+if real_clock is not None:
+    # time.clock is deprecated and was removed in Python 3.8
+    _time_object_fakes.append((real_clock, fake_clock))
+
+
+# id of a real time object or its fake -> the real time object
+_time_object_reals: Dict[int, Any] = {}
+# id of a real time object -> its fake
+_time_object_fakes_by_real_id: Dict[int, Any] = {}
+# names of the fakes themselves, so ``time.time = fake_time`` in our own module does not get swapped
+_time_object_fake_names = tuple(_fake.__name__ for _real, _fake in _time_object_fakes)
+for _real, _fake in _time_object_fakes:
+    _time_object_fakes_by_real_id[id(_real)] = _fake
+    _time_object_reals[id(_real)] = _real
+    _time_object_reals[id(_fake)] = _real
+
+# ids of every real time object and fake, to rule out modules that hold none of them in one go
+_time_object_ids = frozenset(_time_object_reals)
+
+# every real time object and fake, whose reference counts tell when a module bound one of them
+_time_objects = tuple(_time_object for _time_object_pair in _time_object_fakes for _time_object in _time_object_pair)
+
+
+def _refcount_follows_references(value: Any) -> bool:
+    refcount = sys.getrefcount(value)
+    holder = [value]
+    follows = sys.getrefcount(value) == refcount + 1
+    del holder
+    return follows
+
+
+_time_object_refcounts_usable = hasattr(sys, 'getrefcount') and all(map(_refcount_follows_references, _time_objects))
+
 
 def convert_to_timezone_naive(time_to_freeze: datetime.datetime) -> datetime.datetime:
     """
@@ -500,73 +1295,162 @@ def _parse_tz_offset(tz_offset: Union[datetime.timedelta, float]) -> datetime.ti
         return datetime.timedelta(hours=tz_offset)
 
 
+def _parse_tz(tz: Optional[Union[str, datetime.tzinfo]]) -> Optional[datetime.tzinfo]:
+    if tz is None or isinstance(tz, datetime.tzinfo):
+        return tz
+    if zoneinfo is not None:
+        try:
+            return zoneinfo.ZoneInfo(tz)
+        except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+            raise ValueError(f'Unknown time zone: {tz!r}') from None
+    zone = dateutil.tz.gettz(tz)
+    if zone is None:
+        raise ValueError(f'Unknown time zone: {tz!r}')
+    return zone
+
+
 class TickingDateTimeFactory:
+    """
+    Adds the nanoseconds passed on the real ``perf_counter_ns()`` since ``start`` to the frozen time.
+    Unlike the wall clock, that one doesn't jump when the system clock gets adjusted, so the time keeps going forward.
+    With a ``rate`` other than 1 the frozen time runs that many times as fast as the real time.
+    A ``start`` given as a wall clock datetime, like before, is turned into the matching ``perf_counter_ns()`` value.
+    """
+
+    _ns: int
+    _datetime: datetime.datetime
 
-    def __init__(self, time_to_freeze: datetime.datetime, start: datetime.datetime):
+    def __init__(self, time_to_freeze: datetime.datetime, start: Union[int, datetime.datetime], rate: float=1):
         self.time_to_freeze = time_to_freeze
+        if isinstance(start, datetime.datetime):
+            start = real_perf_counter_ns() - _delta_to_ns(real_datetime.now() - start)
         self.start = start
+        self.rate = rate
+
+    @property
+    def time_to_freeze(self) -> datetime.datetime:
+        return self._datetime
+
+    @time_to_freeze.setter
+    def time_to_freeze(self, value: datetime.datetime) -> None:
+        self._ns = _datetime_to_ns(value)
+        self._datetime = value
 
     def __call__(self) -> datetime.datetime:
-        return self.time_to_freeze + (real_datetime.now() - self.start)
+        return _ns_to_datetime(self.time_ns())
+
+    def time_ns(self) -> int:
+        elapsed = real_perf_counter_ns() - self.start
+        if self.rate != 1:
+            elapsed = int(elapsed * self.rate)
+        return self._ns + elapsed
 
     def tick(self, delta: Union[datetime.timedelta, float]=datetime.timedelta(seconds=1)) -> datetime.datetime:
-        if isinstance(delta, numbers.Integral):
-            self.move_to(self.time_to_freeze + datetime.timedelta(seconds=int(delta)))
-        elif isinstance(delta, numbers.Real):
-            self.move_to(self.time_to_freeze + datetime.timedelta(seconds=float(delta)))
-        else:
-            self.move_to(self.time_to_freeze + delta)  # type: ignore
+        # Moves ahead from the time passed so far, so the ticking time never goes back
+        ns = _add_delta_to_ns(self.time_ns(), delta)
+        self.start = real_perf_counter_ns()
+        self.time_to_freeze = _ns_to_datetime(ns)
+        self._ns = ns
         return self.time_to_freeze
 
     def move_to(self, target_datetime: _Freezable) -> None:
         """Moves frozen date to the given ``target_datetime``"""
-        self.start = real_datetime.now()
+        self.start = real_perf_counter_ns()
         self.time_to_freeze = _parse_time_to_freeze(target_datetime)
 
 
 class FrozenDateTimeFactory:
+    """
+    Keeps the frozen time as nanoseconds since the epoch, so ``time.time_ns()`` and friends are exact.
+    The datetime is only built when asked for.
+    """
+
+    _ns: int
+    _datetime: Optional[datetime.datetime]
 
     def __init__(self, time_to_freeze: datetime.datetime):
         self.time_to_freeze = time_to_freeze
 
+    @property
+    def time_to_freeze(self) -> datetime.datetime:
+        if self._datetime is None:
+            self._datetime = _ns_to_datetime(self._ns)
+        return self._datetime
+
+    @time_to_freeze.setter
+    def time_to_freeze(self, value: datetime.datetime) -> None:
+        self._ns = _datetime_to_ns(value)
+        self._datetime = value
+
     def __call__(self) -> datetime.datetime:
-        return self.time_to_freeze
+        frozen_datetime = self._datetime
+        if frozen_datetime is None:
+            frozen_datetime = self._datetime = _ns_to_datetime(self._ns)
+        return frozen_datetime
+
+    def time_ns(self) -> int:
+        return self._ns
 
     def tick(self, delta: Union[datetime.timedelta, float]=datetime.timedelta(seconds=1)) -> datetime.datetime:
-        if isinstance(delta, numbers.Integral):
-            self.move_to(self.time_to_freeze + datetime.timedelta(seconds=int(delta)))
-        elif isinstance(delta, numbers.Real):
-            self.move_to(self.time_to_freeze + datetime.timedelta(seconds=float(delta)))
-        else:
-            self.time_to_freeze += delta  # type: ignore
+        self._ns = _add_delta_to_ns(self._ns, delta)
+        self._datetime = None
         return self.time_to_freeze
 
     def move_to(self, target_datetime: _Freezable) -> None:
         """Moves frozen date to the given ``target_datetime``"""
-        target_datetime = _parse_time_to_freeze(target_datetime)
-        delta = target_datetime - self.time_to_freeze
-        self.tick(delta=delta)
+        self.time_to_freeze = _parse_time_to_freeze(target_datetime)
 
 
 class StepTickTimeFactory:
+    """
+    Keeps the frozen time as nanoseconds since the epoch, and moves it ahead by ``step_width`` on every read.
+    Adding up integers, the steps never drift.
+    """
+
+    _ns: int
+    _datetime: Optional[datetime.datetime]
 
     def __init__(self, time_to_freeze: datetime.datetime, step_width: float):
         self.time_to_freeze = time_to_freeze
         self.step_width = step_width
 
+    @property
+    def time_to_freeze(self) -> datetime.datetime:
+        if self._datetime is None:
+            self._datetime = _ns_to_datetime(self._ns)
+        return self._datetime
+
+    @time_to_freeze.setter
+    def time_to_freeze(self, value: datetime.datetime) -> None:
+        self._ns = _datetime_to_ns(value)
+        self._datetime = value
+
+    @property
+    def step_width(self) -> float:
+        return self._step_width
+
+    @step_width.setter
+    def step_width(self, step_width: float) -> None:
+        self._step_width = step_width
+        self._step_ns = _delta_to_ns(step_width)
+
     def __call__(self) -> datetime.datetime:
         return_time = self.time_to_freeze
         self.tick()
         return return_time
 
+    def time_ns(self) -> int:
+        return_ns = self._ns
+        self._ns += self._step_ns
+        self._datetime = None
+        return return_ns
+
     def tick(self, delta: Union[datetime.timedelta, float, None]=None) -> datetime.datetime:
         if not delta:
-            delta = datetime.timedelta(seconds=self.step_width)
-        elif isinstance(delta, numbers.Integral):
-            delta = datetime.timedelta(seconds=int(delta))
-        elif isinstance(delta, numbers.Real):
-            delta = datetime.timedelta(seconds=float(delta))
-        self.time_to_freeze += delta  # type: ignore
+            self._ns += self._step_ns
+        else:
+            self._ns = _add_delta_to_ns(self._ns, delta)
+        self._datetime = None
         return self.time_to_freeze
 
     def update_step_width(self, step_width: float) -> None:
@@ -579,6 +1463,150 @@ class StepTickTimeFactory:
         self.tick(delta=delta)
 
 
+# (module, attribute name) of every module that got fake_sleep for the real sleep from _update_time_sleep()
+_sleep_site_changes: List[Tuple[Any, str]] = []
+
+
+def _update_time_sleep(ignore: Tuple[str, ...]=(), patch_only: Optional[Tuple[str, ...]]=None, update_cache: bool=True) -> None:
+    """
+    Puts fake_sleep in ``time.sleep``, and in the modules in scope that hold the real sleep, while some freeze
+    asked for ``instant_sleep``. Otherwise ``sleep`` is left to whatever was there, so ``mock.patch('time.sleep')``
+    keeps working around ``freeze_time()``. Pass ``update_cache=False`` when the module cache was just updated.
+    """
+    global _sleep_before_freeze
+    if any(instant_sleep_flags):
+        if time.sleep is fake_sleep:
+            return
+        _sleep_before_freeze = time.sleep
+        time.sleep = fake_sleep  # type: ignore
+        with warnings.catch_warnings():
+            warnings.filterwarnings('ignore')
+
+            if update_cache:
+                _update_module_cache(ignore, patch_only)
+            for module, attribute_name in _get_time_object_sites(real_sleep, ignore, patch_only):
+                if getattr(module, attribute_name, None) is real_sleep:
+                    setattr(module, attribute_name, fake_sleep)
+                    _sleep_site_changes.append((module, attribute_name))
+    else:
+        if time.sleep is fake_sleep:
+            time.sleep = _sleep_before_freeze
+        _sleep_before_freeze = time.sleep if freeze_factories else real_sleep
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+
+            while _sleep_site_changes:
+                module, attribute_name = _sleep_site_changes.pop()
+                if getattr(module, attribute_name, None) is fake_sleep:
+                    setattr(module, attribute_name, real_sleep)
+
+
+def _patch_datetime_module() -> None:
+    """
+    Puts the fake classes in the ``datetime`` module and pickles real datetimes as fakes. Unlike the rest of the
+    fakes this happens for every freeze, also with the fakes installed: pickle looks classes up by name,
+    so a real datetime can only be pickled while ``datetime.datetime`` is the real class.
+    """
+    datetime.datetime = FakeDatetime  # type: ignore[misc]
+    datetime.date = FakeDate  # type: ignore[misc]
+    copyreg.dispatch_table[real_datetime] = pickle_fake_datetime
+    copyreg.dispatch_table[real_date] = pickle_fake_date
+
+
+def _restore_datetime_module() -> None:
+    datetime.datetime = real_datetime  # type: ignore[misc]
+    datetime.date = real_date  # type: ignore[misc]
+    copyreg.dispatch_table.pop(real_datetime)
+    copyreg.dispatch_table.pop(real_date)
+
+
+def _patch_time_modules() -> None:
+    time.time = fake_time
+    time.monotonic = fake_monotonic
+    time.perf_counter = fake_perf_counter
+    time.localtime = fake_localtime  # type: ignore
+    time.gmtime = fake_gmtime  # type: ignore
+    time.strftime = fake_strftime  # type: ignore
+    if uuid_generate_time_attr:
+        setattr(uuid, uuid_generate_time_attr, None)
+    uuid._UuidCreate = None  # type: ignore[attr-defined]
+
+    if _TIME_NS_PRESENT:
+        time.time_ns = fake_time_ns
+
+    if _MONOTONIC_NS_PRESENT:
+        time.monotonic_ns = fake_monotonic_ns
+
+    if _PERF_COUNTER_NS_PRESENT:
+        time.perf_counter_ns = fake_perf_counter_ns
+
+    if real_clock is not None:
+        # time.clock is deprecated and was removed in Python 3.8
+        time.clock = fake_clock  # type: ignore[attr-defined]
+
+
+def _restore_time_modules() -> None:
+    time.time = real_time
+    time.monotonic = real_monotonic
+    time.perf_counter = real_perf_counter
+    time.gmtime = real_gmtime
+    time.localtime = real_localtime
+    time.strftime = real_strftime
+    time.clock = real_clock  # type: ignore[attr-defined]
+
+    if _TIME_NS_PRESENT:
+        time.time_ns = real_time_ns
+
+    if _MONOTONIC_NS_PRESENT:
+        time.monotonic_ns = real_monotonic_ns
+
+    if _PERF_COUNTER_NS_PRESENT:
+        time.perf_counter_ns = real_perf_counter_ns
+
+    if uuid_generate_time_attr:
+        setattr(uuid, uuid_generate_time_attr, real_uuid_generate_time)
+    uuid._UuidCreate = real_uuid_create  # type: ignore[attr-defined]
+    uuid._last_timestamp = None  # type: ignore[attr-defined]
+
+
+# whether the fakes stay installed between freezes, see ``install_fakes()``
+_fakes_installed = False
+
+
+def install_fakes() -> None:
+    """
+    Installs the fakes for good, in the ``time`` and ``datetime`` modules and every module that imported
+    one of their functions. While nothing is frozen they hand out the real time, and ``freeze_time()``
+    no longer has to patch and restore anything: it only pushes and pops the time it freezes.
+    """
+    global _fakes_installed
+
+    if _fakes_installed:
+        return
+    if freeze_factories:
+        raise RuntimeError('install_fakes() can not be called while time is frozen')
+
+    _patch_time_modules()
+    if not _rebinding_active:
+        _rebind_time_object_sites(*_get_default_scope())
+    _fakes_installed = True
+
+
+def uninstall_fakes() -> None:
+    """Puts the real ``time`` and ``datetime`` functions back. Like ``install_fakes()``, it can't be called while time is frozen."""
+    global _fakes_installed
+
+    if not _fakes_installed:
+        return
+    if freeze_factories:
+        raise RuntimeError('uninstall_fakes() can not be called while time is frozen')
+    _fakes_installed = False
+
+    if not _rebinding_active:
+        _restore_time_object_sites(*_get_default_scope())
+    _restore_time_modules()
+
+
 class _freeze_time:
     """
     A class to freeze time for testing purposes.
@@ -592,12 +1620,15 @@ class _freeze_time:
         tz_offset (datetime.timedelta): The timezone offset to apply to the frozen time.
         ignore (List[str]): A list of module names to ignore when freezing time.
         tick (bool): Whether to allow time to tick forward.
+        rate (float): How many times as fast as the real time a ticking frozen time runs.
+        instant_sleep (bool): Whether time.sleep() moves the frozen time ahead and returns right away.
         auto_tick_seconds (float): The number of seconds to auto-tick the frozen time.
         undo_changes (List[Tuple[types.ModuleType, str, Any]]): A list of changes to undo when stopping the frozen time.
-        modules_at_start (Set[str]): A set of module names that were loaded at the start of freezing time.
         as_arg (bool): Whether to pass the frozen time as an argument to the decorated function.
         as_kwarg (str): The name of the keyword argument to pass the frozen time to the decorated function.
         real_asyncio (Optional[bool]): Whether to allow asyncio event loops to see real monotonic time.
+        patch_only (Optional[Tuple[str, ...]]): If given, only modules with these name prefixes are patched.
+        tz (Optional[datetime.tzinfo]): The time zone the local time is in, instead of a fixed tz_offset.
 
     Methods:
         __call__(func): Decorates a function or class to freeze time during its execution.
@@ -620,14 +1651,29 @@ class _freeze_time:
         as_kwarg: str,
         auto_tick_seconds: float,
         real_asyncio: Optional[bool],
+        patch_only: Optional[List[str]]=None,
+        ignore_threads: Optional[List[Union[threading.Thread, int, str]]]=None,
+        tz: Optional[Union[str, datetime.tzinfo]]=None,
+        rate: float=1,
+        instant_sleep: bool=False,
     ):
         self.time_to_freeze = _parse_time_to_freeze(time_to_freeze_str)
         self.tz_offset = _parse_tz_offset(tz_offset)
+        self.tz = _parse_tz(tz)
+        if self.tz is not None and self.tz_offset:
+            raise ValueError('freeze_time() takes either a tz or a tz_offset, not both')
         self.ignore = tuple(ignore)
+        self.patch_only = tuple(patch_only) if patch_only is not None else None
+        self.ignore_threads = tuple(ignore_threads or ())
         self.tick = tick
+        if rate <= 0:
+            raise ValueError('freeze_time() expects a rate above 0')
+        if rate != 1 and not tick:
+            raise ValueError('freeze_time() only takes a rate with tick=True')
+        self.rate = rate
+        self.instant_sleep = instant_sleep
         self.auto_tick_seconds = auto_tick_seconds
         self.undo_changes: List[Tuple[types.ModuleType, str, Any]] = []
-        self.modules_at_start: Set[str] = set()
         self.as_arg = as_arg
         self.as_kwarg = as_kwarg
         self.real_asyncio = real_asyncio
@@ -745,91 +1791,62 @@ class _freeze_time:
         if self.auto_tick_seconds:
             freeze_factory: Union[StepTickTimeFactory, TickingDateTimeFactory, FrozenDateTimeFactory] = StepTickTimeFactory(self.time_to_freeze, self.auto_tick_seconds)
         elif self.tick:
-            freeze_factory = TickingDateTimeFactory(self.time_to_freeze, real_datetime.now())
+            freeze_factory = TickingDateTimeFactory(self.time_to_freeze, real_perf_counter_ns(), self.rate)
         else:
             freeze_factory = FrozenDateTimeFactory(self.time_to_freeze)
 
+        if not freeze_factories and config.settings.keep_fakes_installed:
+            install_fakes()
+
         is_already_started = len(freeze_factories) > 0
         freeze_factories.append(freeze_factory)
         tz_offsets.append(self.tz_offset)
+        tz_zones.append(self.tz)
+        tz_infos.append((self.tz or dateutil.tz.tzoffset("freezegun", self.tz_offset), None, None))
         ignore_lists.append(self.ignore)
+        ignore_thread_lists.append(self.ignore_threads)
         tick_flags.append(self.tick)
+        instant_sleep_flags.append(self.instant_sleep)
 
         if is_already_started:
+            _update_time_sleep(self.ignore, self.patch_only)
             return freeze_factory
 
-        # Change the modules
-        datetime.datetime = FakeDatetime  # type: ignore[misc]
-        datetime.date = FakeDate  # type: ignore[misc]
-
-        time.time = fake_time
-        time.monotonic = fake_monotonic
-        time.perf_counter = fake_perf_counter
-        time.localtime = fake_localtime  # type: ignore
-        time.gmtime = fake_gmtime  # type: ignore
-        time.strftime = fake_strftime  # type: ignore
-        if uuid_generate_time_attr:
-            setattr(uuid, uuid_generate_time_attr, None)
-        uuid._UuidCreate = None  # type: ignore[attr-defined]
-        uuid._last_timestamp = None  # type: ignore[attr-defined]
+        # Change any place where the module had already been imported,
+        # unless the fakes are already there for good
+        _update_rebinding()
+        patch_module_sites = not _rebinding_active and not _fakes_installed
+        if patch_module_sites:
+            # Before anything gets patched, so the time objects have the same reference counts as after stop()
+            with warnings.catch_warnings():
+                warnings.filterwarnings('ignore')
 
-        copyreg.dispatch_table[real_datetime] = pickle_fake_datetime
-        copyreg.dispatch_table[real_date] = pickle_fake_date
-
-        # Change any place where the module had already been imported
-        to_patch = [
-            ('real_date', real_date, FakeDate),
-            ('real_datetime', real_datetime, FakeDatetime),
-            ('real_gmtime', real_gmtime, fake_gmtime),
-            ('real_localtime', real_localtime, fake_localtime),
-            ('real_monotonic', real_monotonic, fake_monotonic),
-            ('real_perf_counter', real_perf_counter, fake_perf_counter),
-            ('real_strftime', real_strftime, fake_strftime),
-            ('real_time', real_time, fake_time),
-        ]
-
-        if _TIME_NS_PRESENT:
-            time.time_ns = fake_time_ns
-            to_patch.append(('real_time_ns', real_time_ns, fake_time_ns))
-
-        if _MONOTONIC_NS_PRESENT:
-            time.monotonic_ns = fake_monotonic_ns
-            to_patch.append(('real_monotonic_ns', real_monotonic_ns, fake_monotonic_ns))
-
-        if _PERF_COUNTER_NS_PRESENT:
-            time.perf_counter_ns = fake_perf_counter_ns
-            to_patch.append(('real_perf_counter_ns', real_perf_counter_ns, fake_perf_counter_ns))
-
-        if real_clock is not None:
-            # time.clock is deprecated and was removed in Python 3.8
-            time.clock = fake_clock  # type: ignore[attr-defined]
-            to_patch.append(('real_clock', real_clock, fake_clock))
-
-        self.fake_names = tuple(fake.__name__ for real_name, real, fake in to_patch)  # type: ignore
-        self.reals = {id(fake): real for real_name, real, fake in to_patch}
-        fakes = {id(real): fake for real_name, real, fake in to_patch}
-        add_change = self.undo_changes.append
+                _update_module_cache(self.ignore, self.patch_only)
 
-        # Save the current loaded modules
-        self.modules_at_start = set(sys.modules.keys())
+        _patch_datetime_module()
 
-        with warnings.catch_warnings():
-            warnings.filterwarnings('ignore')
+        # Change the modules, unless the fakes are installed for good
+        if not _fakes_installed:
+            _patch_time_modules()
+        uuid._last_timestamp = None  # type: ignore[attr-defined]
 
-            for mod_name, module in list(sys.modules.items()):
-                if mod_name is None or module is None or mod_name == __name__:
-                    continue
-                elif mod_name.startswith(self.ignore) or mod_name.endswith('.six.moves'):
-                    continue
-                elif (not hasattr(module, "__name__") or module.__name__ in ('datetime', 'time')):
-                    continue
+        add_change = self.undo_changes.append
 
-                module_attrs = _get_cached_module_attributes(module)
-                for attribute_name, attribute_value in module_attrs:
-                    fake = fakes.get(id(attribute_value))
-                    if fake:
-                        setattr(module, attribute_name, fake)
-                        add_change((module, attribute_name, attribute_value))
+        if patch_module_sites:
+            with warnings.catch_warnings():
+                warnings.filterwarnings('ignore')
+
+                for real, fake in _time_object_fakes:
+                    for module, attribute_name in _get_time_object_sites(real, self.ignore, self.patch_only):
+                        attribute_value = getattr(module, attribute_name, None)
+                        # sleep is only swapped for freezes with instant_sleep, by _update_time_sleep()
+                        if attribute_value is real and real is not real_sleep:
+                            setattr(module, attribute_name, fake)
+                            add_change((module, attribute_name, real))
+                        elif attribute_value is fake and attribute_name not in _time_object_fake_names:
+                            # Left over from an earlier freeze, e.g. bound after its module got imported
+                            add_change((module, attribute_name, real))
+        _update_time_sleep(self.ignore, self.patch_only, update_cache=not patch_module_sites)
 
         if self.real_asyncio:
             # To avoid breaking `asyncio.sleep()`, let asyncio event loops see real
@@ -852,66 +1869,39 @@ class _freeze_time:
     def stop(self) -> None:
         freeze_factories.pop()
         ignore_lists.pop()
+        ignore_thread_lists.pop()
         tick_flags.pop()
+        instant_sleep_flags.pop()
         tz_offsets.pop()
+        tz_zones.pop()
+        tz_infos.pop()
+        _update_time_sleep()
 
         if not freeze_factories:
-            datetime.datetime = real_datetime  # type: ignore[misc]
-            datetime.date = real_date  # type: ignore[misc]
-            copyreg.dispatch_table.pop(real_datetime)
-            copyreg.dispatch_table.pop(real_date)
-            for module_or_object, attribute, original_value in self.undo_changes:
-                setattr(module_or_object, attribute, original_value)
-            self.undo_changes = []
-
-            # Restore modules loaded after start()
-            modules_to_restore = set(sys.modules.keys()) - self.modules_at_start
-            self.modules_at_start = set()
-            with warnings.catch_warnings():
-                warnings.simplefilter('ignore')
-                for mod_name in modules_to_restore:
-                    module = sys.modules.get(mod_name, None)
-                    if mod_name is None or module is None:
-                        continue
-                    elif mod_name.startswith(self.ignore) or mod_name.endswith('.six.moves'):
-                        continue
-                    elif not hasattr(module, "__name__") or module.__name__ in ('datetime', 'time'):
-                        continue
-                    for module_attribute in dir(module):
-
-                        if module_attribute in self.fake_names:
-                            continue
-                        try:
-                            attribute_value = getattr(module, module_attribute)
-                        except (ImportError, AttributeError, TypeError):
-                            # For certain libraries, this can result in ImportError(_winreg) or AttributeError (celery)
-                            continue
-
-                        real = self.reals.get(id(attribute_value))
-                        if real:
-                            setattr(module, module_attribute, real)
-
-            time.time = real_time
-            time.monotonic = real_monotonic
-            time.perf_counter = real_perf_counter
-            time.gmtime = real_gmtime
-            time.localtime = real_localtime
-            time.strftime = real_strftime
-            time.clock = real_clock  # type: ignore[attr-defined]
-
-            if _TIME_NS_PRESENT:
-                time.time_ns = real_time_ns
-
-            if _MONOTONIC_NS_PRESENT:
-                time.monotonic_ns = real_monotonic_ns
-
-            if _PERF_COUNTER_NS_PRESENT:
-                time.perf_counter_ns = real_perf_counter_ns
-
-            if uuid_generate_time_attr:
-                setattr(uuid, uuid_generate_time_attr, real_uuid_generate_time)
-            uuid._UuidCreate = real_uuid_create  # type: ignore[attr-defined]
-            uuid._last_timestamp = None  # type: ignore[attr-defined]
+            # Popped rather than looped over, so no local variable keeps a time object referenced, see _time_objects_rebound()
+            while self.undo_changes:
+                setattr(*self.undo_changes.pop())
+            _restore_datetime_module()
+
+            if _fakes_installed:
+                uuid._last_timestamp = None  # type: ignore[attr-defined]
+                return
+            _restore_time_modules()
+
+            # Restore modules loaded after start(): those imported through the import hook were taken note of,
+            # anything else (like modules put into sys.modules by hand) gets analyzed now. Modules that were
+            # only changed in place are left to the fingerprint check of the next start()
+            if not _rebinding_active:
+                frozen_import_names = set(_frozen_import_names)
+                _restore_frozen_imports()
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore')
+
+                    with _module_cache_lock:
+                        scope = (self.ignore, self.patch_only)
+                        changed = _update_seen_modules(_time_objects_rebound(scope)) - frozen_import_names
+                        analyzed = _analyze_queued_modules(changed, self.ignore, self.patch_only)
+                _restore_analyzed_modules(analyzed)
 
     def decorate_coroutine(self, coroutine: "Callable[P, Awaitable[T]]") -> "Callable[P, Awaitable[T]]":
         return wrap_coroutine(self, coroutine)
@@ -954,7 +1944,9 @@ class _freeze_time:
 
 
 def freeze_time(time_to_freeze: Optional[_Freezable]=None, tz_offset: Union[int, datetime.timedelta]=0, ignore: Optional[List[str]]=None, tick: bool=False, as_arg: bool=False, as_kwarg: str='',
-                auto_tick_seconds: float=0, real_asyncio: bool=False) -> _freeze_time:
+                auto_tick_seconds: float=0, real_asyncio: bool=False, patch_only: Optional[List[str]]=None,
+                ignore_threads: Optional[List[Union[threading.Thread, int, str]]]=None,
+                tz: Optional[Union[str, datetime.tzinfo]]=None, rate: float=1, instant_sleep: bool=False) -> _freeze_time:
     """
     Freezes time for testing purposes.
 
@@ -971,6 +1963,15 @@ def freeze_time(time_to_freeze: Optional[_Freezable]=None, tz_offset: Union[int,
         as_kwarg (str): The name of the keyword argument to pass the frozen time to the decorated function.
         auto_tick_seconds (float): The number of seconds to auto-tick the frozen time.
         real_asyncio (bool): Whether to allow asyncio event loops to see real monotonic time.
+        patch_only (Optional[List[str]]): If given, only modules with these name prefixes are patched.
+        ignore_threads (Optional[List[Union[threading.Thread, int, str]]]): Threads that keep seeing the real time,
+            given as thread objects, idents or patterns for their names.
+        tz (Optional[Union[str, datetime.tzinfo]]): The time zone the local time is in, as a tzinfo or an IANA name
+            like "Europe/Berlin". Unlike tz_offset, its offset follows daylight saving time. Can't be combined with tz_offset.
+        rate (float): With tick=True, how many times as fast as the real time the frozen time runs, like 60 for a minute
+            per second. Applies to every faked clock.
+        instant_sleep (bool): Whether time.sleep() moves the frozen time ahead by the given seconds and returns right away,
+            instead of blocking for real.
 
     Returns:
         _freeze_time: An instance of the _freeze_time class.
@@ -989,14 +1990,14 @@ def freeze_time(time_to_freeze: Optional[_Freezable]=None, tz_offset: Union[int,
         raise SystemError('Calling freeze_time with tick=True is only compatible with CPython')
 
     if isinstance(time_to_freeze, types.FunctionType):
-        return freeze_time(time_to_freeze(), tz_offset, ignore, tick, as_arg, as_kwarg, auto_tick_seconds, real_asyncio=real_asyncio)
+        return freeze_time(time_to_freeze(), tz_offset, ignore, tick, as_arg, as_kwarg, auto_tick_seconds, real_asyncio=real_asyncio, patch_only=patch_only, ignore_threads=ignore_threads, tz=tz, rate=rate, instant_sleep=instant_sleep)
 
     if isinstance(time_to_freeze, types.GeneratorType):
-        return freeze_time(next(time_to_freeze), tz_offset, ignore, tick, as_arg, as_kwarg, auto_tick_seconds, real_asyncio=real_asyncio)
+        return freeze_time(next(time_to_freeze), tz_offset, ignore, tick, as_arg, as_kwarg, auto_tick_seconds, real_asyncio=real_asyncio, patch_only=patch_only, ignore_threads=ignore_threads, tz=tz, rate=rate, instant_sleep=instant_sleep)
 
     if MayaDT is not None and isinstance(time_to_freeze, MayaDT):
         return freeze_time(time_to_freeze.datetime(), tz_offset, ignore,
-                           tick, as_arg, as_kwarg, auto_tick_seconds, real_asyncio=real_asyncio)
+                           tick, as_arg, as_kwarg, auto_tick_seconds, real_asyncio=real_asyncio, patch_only=patch_only, ignore_threads=ignore_threads, tz=tz, rate=rate, instant_sleep=instant_sleep)
 
     if ignore is None:
         ignore = []
@@ -1004,6 +2005,15 @@ def freeze_time(time_to_freeze: Optional[_Freezable]=None, tz_offset: Union[int,
     if config.settings.default_ignore_list:
         ignore.extend(config.settings.default_ignore_list)
 
+    if patch_only is None:
+        patch_only = config.settings.default_patch_only
+
+    if ignore_threads is None:
+        ignore_threads = []
+    ignore_threads = ignore_threads[:]
+    if config.settings.default_ignore_threads:
+        ignore_threads.extend(config.settings.default_ignore_threads)
+
     return _freeze_time(
         time_to_freeze_str=time_to_freeze,
         tz_offset=tz_offset,
@@ -1013,6 +2023,11 @@ def freeze_time(time_to_freeze: Optional[_Freezable]=None, tz_offset: Union[int,
         as_kwarg=as_kwarg,
         auto_tick_seconds=auto_tick_seconds,
         real_asyncio=real_asyncio,
+        patch_only=patch_only,
+        ignore_threads=ignore_threads,
+        tz=tz,
+        rate=rate,
+        instant_sleep=instant_sleep,
     )
 
 
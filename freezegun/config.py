@@ -1,4 +1,5 @@
-from typing import List, Optional
+import threading
+from typing import List, Optional, Union
 
 
 DEFAULT_IGNORE_LIST = [
@@ -18,8 +19,13 @@ DEFAULT_IGNORE_LIST = [
 
 
 class Settings:
-    def __init__(self, default_ignore_list: Optional[List[str]]=None) -> None:
+    def __init__(self, default_ignore_list: Optional[List[str]]=None, scan_with_getattr: Optional[List[str]]=None, default_patch_only: Optional[List[str]]=None, rebind_on_import: bool=False, keep_fakes_installed: bool=False, default_ignore_threads: Optional[List[Union[threading.Thread, int, str]]]=None) -> None:
         self.default_ignore_list = default_ignore_list or DEFAULT_IGNORE_LIST[:]
+        self.scan_with_getattr = scan_with_getattr or []
+        self.default_patch_only = default_patch_only
+        self.rebind_on_import = rebind_on_import
+        self.keep_fakes_installed = keep_fakes_installed
+        self.default_ignore_threads = default_ignore_threads or []
 
 
 settings = Settings()
@@ -29,13 +35,23 @@ class ConfigurationError(Exception):
     pass
 
 
-def configure(default_ignore_list: Optional[List[str]]=None, extend_ignore_list: Optional[List[str]]=None) -> None:
+def configure(default_ignore_list: Optional[List[str]]=None, extend_ignore_list: Optional[List[str]]=None, scan_with_getattr: Optional[List[str]]=None, default_patch_only: Optional[List[str]]=None, rebind_on_import: Optional[bool]=None, keep_fakes_installed: Optional[bool]=None, default_ignore_threads: Optional[List[Union[threading.Thread, int, str]]]=None) -> None:
     if default_ignore_list is not None and extend_ignore_list is not None:
         raise ConfigurationError("Either default_ignore_list or extend_ignore_list might be given, not both")
     if default_ignore_list is not None:
         settings.default_ignore_list = default_ignore_list
     if extend_ignore_list:
         settings.default_ignore_list = list(dict.fromkeys([*settings.default_ignore_list, *extend_ignore_list]))
+    if scan_with_getattr is not None:
+        settings.scan_with_getattr = scan_with_getattr
+    if default_patch_only is not None:
+        settings.default_patch_only = default_patch_only
+    if rebind_on_import is not None:
+        settings.rebind_on_import = rebind_on_import
+    if keep_fakes_installed is not None:
+        settings.keep_fakes_installed = keep_fakes_installed
+    if default_ignore_threads is not None:
+        settings.default_ignore_threads = default_ignore_threads
 
 
 def reset_config() -> None:
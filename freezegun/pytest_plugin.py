@@ -0,0 +1,24 @@
+"""
+Warms up the module cache of freezegun while pytest collects the tests, so the first frozen test
+does not pay for analyzing every loaded module. Enable it with ``pytest -p freezegun.pytest_plugin``.
+"""
+import threading
+from typing import Optional
+
+import pytest
+
+from .api import warmup
+
+_warmup_thread: Optional[threading.Thread] = None
+
+
+def pytest_sessionstart(session: pytest.Session) -> None:
+    global _warmup_thread
+    _warmup_thread = warmup(background=True)
+
+
+def pytest_collection_finish(session: pytest.Session) -> None:
+    if _warmup_thread is not None:
+        _warmup_thread.join()
+    # Collecting imported the test modules, analyze those before the first test runs
+    warmup()
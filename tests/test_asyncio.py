@@ -1,9 +1,13 @@
 import asyncio
 import datetime
+import socket
+import threading
 import time
 from typing import Any
 
-from freezegun import freeze_time
+import pytest
+
+from freezegun import VirtualTimeEventLoop, api, freeze_time
 
 
 def test_datetime_in_coroutine() -> None:
@@ -79,3 +83,139 @@ def test_asyncio_to_call_later_with_frozen_time() -> None:
 
     with freeze_time('1970-01-02', real_asyncio=True):
         asyncio.run(coroutine())
+
+
+def run_in_virtual_time(coroutine: Any) -> Any:
+    loop = VirtualTimeEventLoop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_virtual_time_event_loop_jumps_to_timers() -> None:
+    calls = []
+
+    async def coroutine() -> None:
+        loop = asyncio.get_running_loop()
+        loop.call_later(7200, lambda: calls.append(('call_later', time.time())))
+        await asyncio.sleep(3600)
+        calls.append(('sleep', time.time()))
+        await asyncio.sleep(3600)
+
+    with freeze_time('1970-01-02'):
+        start = api.real_monotonic()
+        run_in_virtual_time(coroutine())
+        assert api.real_monotonic() - start < 10
+        assert calls == [('sleep', 86400 + 3600), ('call_later', 86400 + 7200)]
+        assert datetime.datetime.now() == datetime.datetime(1970, 1, 2, 2)
+
+
+def test_virtual_time_event_loop_timeouts() -> None:
+    async def coroutine() -> float:
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(asyncio.sleep(86400), timeout=60)
+        return time.monotonic()
+
+    with freeze_time('2012-01-14'):
+        assert run_in_virtual_time(coroutine()) == 1326499200 + 60
+
+
+def test_virtual_time_event_loop_waits_for_executor_jobs() -> None:
+    def work() -> str:
+        api.real_sleep(0.2)
+        return 'done'
+
+    async def coroutine() -> str:
+        loop = asyncio.get_running_loop()
+        result = await asyncio.wait_for(loop.run_in_executor(None, work), timeout=30)
+        # Without jobs left, it jumps to the timers again
+        await asyncio.sleep(3600)
+        return result
+
+    with freeze_time('2012-01-14'):
+        start = api.real_monotonic()
+        assert run_in_virtual_time(coroutine()) == 'done'
+        assert api.real_monotonic() - start < 10
+        # The frozen time followed the real time while the job ran
+        assert datetime.datetime(2012, 1, 14, 1, 0, 0, 200000) <= datetime.datetime.now() < datetime.datetime(2012, 1, 14, 1, 0, 10)
+
+
+def test_virtual_time_event_loop_gives_registered_io_a_grace_period() -> None:
+    reader, writer = socket.socketpair()
+
+    async def coroutine() -> bytes:
+        loop = asyncio.get_running_loop()
+        received: asyncio.Future[bytes] = loop.create_future()
+        loop.add_reader(reader, lambda: received.set_result(reader.recv(1)))
+        threading.Timer(0.01, writer.send, (b'x',)).start()
+        try:
+            result = await asyncio.wait_for(received, timeout=30)
+            # Nothing comes in any more, so after the grace period it jumps to the timer
+            await asyncio.sleep(3600)
+        finally:
+            loop.remove_reader(reader)
+        return result
+
+    try:
+        with freeze_time('2012-01-14'):
+            start = api.real_monotonic()
+            assert run_in_virtual_time(coroutine()) == b'x'
+            assert api.real_monotonic() - start < 10
+            assert datetime.datetime.now() == datetime.datetime(2012, 1, 14, 1)
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_virtual_time_event_loop_without_freeze() -> None:
+    async def coroutine() -> float:
+        before = time.monotonic()
+        await asyncio.sleep(0.01)
+        return time.monotonic() - before
+
+    assert run_in_virtual_time(coroutine()) >= 0.01
+
+
+def test_virtual_time_event_loop_with_decorated_coroutine() -> None:
+    calls = []
+
+    @freeze_time('2012-01-14')
+    async def frozen_coroutine() -> float:
+        await asyncio.sleep(60)
+        return time.time()
+
+    async def coroutine() -> float:
+        loop = asyncio.get_running_loop()
+        # Scheduled on the real monotonic time, and due while the coroutine sleeps on the frozen time
+        loop.call_later(1, lambda: calls.append(time.time()))
+        before = loop.time()
+        result: float = await frozen_coroutine()
+        assert loop.time() - before >= 60
+        return result
+
+    start = api.real_monotonic()
+    assert run_in_virtual_time(coroutine()) == 1326499260.0
+    assert api.real_monotonic() - start < 10
+    assert len(calls) == 1
+    assert 1326499200 < calls[0] < 1326499202
+
+
+def test_virtual_time_event_loop_time_carries_on_between_freezes() -> None:
+    loop = VirtualTimeEventLoop()
+    try:
+        with freeze_time('2013-01-14') as outer:
+            start = loop.time()
+            outer.tick(10)
+            assert loop.time() == pytest.approx(start + 10)
+            # An earlier frozen time doesn't take the loop time back
+            with freeze_time('2012-01-14') as inner:
+                assert loop.time() == pytest.approx(start + 10)
+                inner.tick(5)
+                assert loop.time() == pytest.approx(start + 15)
+            assert loop.time() == pytest.approx(start + 15)
+            outer.tick(1)
+            assert loop.time() == pytest.approx(start + 16)
+        assert loop.time() >= start + 16
+    finally:
+        loop.close()
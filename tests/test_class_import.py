@@ -1,5 +1,8 @@
 import time
 import sys
+import threading
+from typing import Dict
+from unittest import mock
 from .fake_module import (
     fake_date_function,
     fake_datetime_function,
@@ -89,6 +92,52 @@ def test_fake_uses_real_when_ignored() -> None:
     assert real_time_before <= real_time <= real_time_after
 
 
+def test_fake_follows_ignore_list_of_innermost_freeze() -> None:
+    with freeze_time('2012-01-14', ignore=['tests.test_class_import']):
+        assert time.time() != 1326499200.0
+        with freeze_time('2012-01-14', ignore=['tests.fake_module']):
+            assert time.time() == 1326499200.0
+        assert time.time() != 1326499200.0
+
+    with freeze_time('2012-01-14'):
+        assert time.time() == 1326499200.0
+
+
+def test_fake_uses_real_in_ignored_threads() -> None:
+    results: Dict[str, float] = {}
+
+    def read_time() -> None:
+        results[threading.current_thread().name] = time.time()
+
+    threads = [
+        threading.Thread(target=read_time, name='heartbeat-1'),
+        threading.Thread(target=read_time, name='worker'),
+        threading.Thread(target=read_time, name='reaper'),
+    ]
+    # Threads are ignored without looking at the call stack, which would find the ignored threading module
+    with mock.patch('freezegun.api.call_stack_inspection_limit', 0), \
+            freeze_time('2012-01-14', ignore_threads=['heartbeat-*', threads[2]]):
+        for thread in threads:
+            thread.start()
+            thread.join()
+        assert time.time() == 1326499200.0
+
+    assert results['heartbeat-1'] != 1326499200.0
+    assert results['worker'] == 1326499200.0
+    assert results['reaper'] != 1326499200.0
+
+
+def test_patch_only_skips_other_modules() -> None:
+    with freeze_time('2012-01-14', patch_only=['tests.test_class_import']):
+        assert datetime.datetime.now() == datetime.datetime(2012, 1, 14)
+        assert fake_module.time is not fake_time  # type: ignore[attr-defined]
+        assert fake_module.datetime is not FakeDatetime  # type: ignore[attr-defined]
+
+    with freeze_time('2012-01-14', patch_only=['tests.fake_module']):
+        assert fake_module.time is fake_time  # type: ignore[attr-defined]
+        assert fake_module.datetime is FakeDatetime  # type: ignore[attr-defined]
+
+
 def test_can_ignore_email_module() -> None:
     from email.utils import formatdate
     with freeze_time('2012-01-14'):
@@ -31,6 +31,11 @@ def test_default_ignore_list_is_overridden(ignorelist: List[str]) -> None:
             as_kwarg='',
             auto_tick_seconds=0,
             real_asyncio=False,
+            patch_only=None,
+            ignore_threads=[],
+            tz=None,
+            rate=1,
+            instant_sleep=False,
         )
 
 
@@ -66,6 +71,11 @@ def test_extend_default_ignore_list(ignorelist: List[str]) -> None:
             as_kwarg='',
             auto_tick_seconds=0,
             real_asyncio=False,
+            patch_only=None,
+            ignore_threads=[],
+            tz=None,
+            rate=1,
+            instant_sleep=False,
         )
 
 def test_extend_default_ignore_list_duplicate_items() -> None:
@@ -103,4 +113,31 @@ def test_extend_default_ignore_list_duplicate_items() -> None:
             as_kwarg='',
             auto_tick_seconds=0,
             real_asyncio=False,
+            patch_only=None,
+            ignore_threads=[],
+            tz=None,
+            rate=1,
+            instant_sleep=False,
         )
+
+
+def test_default_patch_only() -> None:
+    freezegun.configure(default_patch_only=['ourapp'])
+
+    with mock.patch("freezegun.api._freeze_time.__init__", return_value=None) as _freeze_time_init_mock:
+
+        freezegun.freeze_time("2020-10-06")
+        freezegun.freeze_time("2020-10-06", patch_only=['otherapp'])
+
+        assert _freeze_time_init_mock.call_args_list[0].kwargs['patch_only'] == ['ourapp']
+        assert _freeze_time_init_mock.call_args_list[1].kwargs['patch_only'] == ['otherapp']
+
+
+def test_default_ignore_threads() -> None:
+    freezegun.configure(default_ignore_threads=['heartbeat-*'])
+
+    with mock.patch("freezegun.api._freeze_time.__init__", return_value=None) as _freeze_time_init_mock:
+
+        freezegun.freeze_time("2020-10-06", ignore_threads=['reaper'])
+
+        assert _freeze_time_init_mock.call_args_list[0].kwargs['ignore_threads'] == ['reaper', 'heartbeat-*']
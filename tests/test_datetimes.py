@@ -7,13 +7,15 @@ import locale
 import sys
 from typing import Any, Callable
 from unittest import SkipTest
+import dateutil.tz
+from dateutil.relativedelta import relativedelta
 from dateutil.tz import UTC
 
 import pytest
 from tests import utils
 
 from freezegun import freeze_time
-from freezegun.api import FakeDatetime, FakeDate
+from freezegun.api import FakeDatetime, FakeDate, real_date, real_datetime
 
 try:
     import maya  # type: ignore
@@ -193,6 +195,15 @@ def test_manual_increment() -> None:
         assert frozen_datetime() == expected
 
 
+@pytest.mark.parametrize("kwargs", ({}, {"auto_tick_seconds": 5}, {"tick": True}))
+def test_tick_relativedelta(kwargs: Any) -> None:
+    with freeze_time("2012-01-14", **kwargs) as frozen_datetime:
+        frozen_datetime.tick(relativedelta(months=1))  # type: ignore[arg-type]
+        assert datetime.datetime(2012, 2, 14) <= frozen_datetime.time_to_freeze < datetime.datetime(2012, 2, 14, 0, 1)
+        frozen_datetime.tick(relativedelta(hours=1))  # type: ignore[arg-type]
+        assert datetime.datetime(2012, 2, 14, 1) <= frozen_datetime.time_to_freeze < datetime.datetime(2012, 2, 14, 1, 1)
+
+
 def test_move_to() -> None:
     initial_datetime = datetime.datetime(year=1, month=7, day=12,
                                         hour=15, minute=6, second=3)
@@ -209,6 +220,22 @@ def test_move_to() -> None:
         assert frozen_datetime() == initial_datetime
 
 
+def test_derived_values_follow_the_frozen_instant() -> None:
+    with freeze_time('2012-01-14 03:21:34') as frozen_datetime:
+        assert time.time() == 1326511294.0
+        assert time.gmtime().tm_sec == 34
+        assert time.localtime() == time.localtime()
+
+        frozen_datetime.tick()
+        assert time.time() == 1326511295.0
+        assert time.gmtime().tm_sec == 35
+        assert time.strftime('%S', time.gmtime()) == '35'
+
+        frozen_datetime.time_to_freeze = datetime.datetime(2012, 1, 14, 3, 21, 40)
+        assert time.time() == 1326511300.0
+        assert time.gmtime().tm_sec == 40
+
+
 def test_bad_time_argument() -> None:
     try:
         freeze_time("2012-13-14", tz_offset=-4)
@@ -526,6 +553,21 @@ def test_isinstance_without_active() -> None:
     assert isinstance(today, datetime.date)
 
 
+@freeze_time("Jan 14th, 2012")
+def test_isinstance_of_real_objects_with_active() -> None:
+    real_now = real_datetime(2012, 1, 14)
+    assert isinstance(real_now, datetime.datetime)
+    assert isinstance(real_now, datetime.date)
+    assert isinstance(real_now.date(), datetime.date)
+    assert not isinstance(real_now.date(), datetime.datetime)
+    assert not isinstance('2012-01-14', datetime.date)
+
+    assert issubclass(real_datetime, datetime.datetime)
+    assert issubclass(real_date, datetime.date)
+    assert not issubclass(real_date, datetime.datetime)
+    assert not issubclass(str, datetime.date)
+
+
 class TestUnitTestMethodDecorator(unittest.TestCase):
     @freeze_time('2013-04-09')
     def test_method_decorator_works_on_unittest(self) -> None:
@@ -775,9 +817,25 @@ def test_time_ns_with_microseconds() -> None:
     freezer = freeze_time("2024-03-20 18:21:10.12345")
 
     with freezer:
-        assert time.time_ns() == 1710958870123450112
+        assert time.time_ns() == 1710958870123450000
+
+    assert time.time_ns() != 1710958870123450000
+
+
+def test_time_ns_is_exact_below_microseconds() -> None:
+    with freeze_time("2024-03-20 18:21:10.12345") as frozen_datetime:
+        frozen_datetime.tick(0.0000001)
+        assert time.time_ns() == 1710958870123450100
+        assert time.monotonic_ns() == 1710958870123450100
+        assert datetime.datetime.now() == datetime.datetime(2024, 3, 20, 18, 21, 10, 123450)
+
 
-    assert time.time_ns() != 1710958870123450112
+def test_auto_tick_does_not_drift() -> None:
+    with freeze_time("2024-03-20", auto_tick_seconds=0.1):
+        first = time.time_ns()
+        for _ in range(1000):
+            time.time_ns()
+        assert time.time_ns() - first == 1001 * 100000000
 
 
 def test_compare_datetime_and_time_with_timezone(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -812,6 +870,77 @@ def test_timestamp_with_tzoffset() -> None:
         assert utcnow == datetime.datetime.utcfromtimestamp(time.time())
         assert utcnow == datetime.datetime.utcnow()
 
+def test_tzinfo_objects_are_shared_within_a_freeze(monkeypatch: pytest.MonkeyPatch) -> None:
+    try:
+        with monkeypatch.context() as m, freeze_time("2000-01-01", tz_offset=6):
+            aware = datetime.datetime.now(tz=UTC)
+            assert aware.astimezone().tzinfo is aware.astimezone().tzinfo
+            assert datetime.datetime.fromtimestamp(0) == datetime.datetime(1970, 1, 1, 6)
+
+            with freeze_time("2000-01-01", tz_offset=-2):
+                assert datetime.datetime.fromtimestamp(0) == datetime.datetime(1969, 12, 31, 22)
+            assert datetime.datetime.fromtimestamp(0) == datetime.datetime(1970, 1, 1, 6)
+
+            m.setenv("TZ", "Europe/Berlin")
+            time.tzset()
+            assert aware.astimezone().utcoffset() == datetime.timedelta(hours=1)
+    finally:
+        time.tzset()  # set the timezone back to what is was before
+
+
+def test_freeze_with_time_zone() -> None:
+    with freeze_time("2012-01-14 23:30:00", tz="Europe/Berlin") as frozen:
+        assert datetime.datetime.now() == datetime.datetime(2012, 1, 15, 0, 30)
+        assert datetime.datetime.utcnow() == datetime.datetime(2012, 1, 14, 23, 30)
+        assert datetime.date.today() == datetime.date(2012, 1, 15)
+        assert time.localtime().tm_hour == 0
+        assert time.localtime().tm_isdst == 0
+        assert time.strftime("%H:%M") == "00:30"
+        assert datetime.datetime.now().timestamp() == time.time()
+        assert datetime.datetime.fromtimestamp(time.time()) == datetime.datetime.now()
+        assert datetime.datetime.now(tz=UTC).astimezone().utcoffset() == datetime.timedelta(hours=1)
+
+        # Daylight saving time starts on the 25th of March
+        frozen.move_to("2012-03-25 01:30:00")
+        assert datetime.datetime.now() == datetime.datetime(2012, 3, 25, 3, 30)
+        assert time.localtime().tm_isdst == 1
+        assert datetime.datetime.now().timestamp() == time.time()
+        assert datetime.datetime.fromtimestamp(time.time() - 3600) == datetime.datetime(2012, 3, 25, 1, 30)
+
+
+def test_astimezone_of_naive_value_in_time_zone(monkeypatch: pytest.MonkeyPatch) -> None:
+    try:
+        with monkeypatch.context() as m:
+            # A host zone far away from the frozen one
+            m.setenv("TZ", "America/Los_Angeles")
+            time.tzset()
+            with freeze_time("2012-01-14 23:30:00", tz="Europe/Berlin"):
+                local = datetime.datetime.now().astimezone()
+                assert local.replace(tzinfo=None) == datetime.datetime(2012, 1, 15, 0, 30)
+                assert local.utcoffset() == datetime.timedelta(hours=1)
+                assert datetime.datetime.now().astimezone(UTC) == datetime.datetime(2012, 1, 14, 23, 30, tzinfo=UTC)
+    finally:
+        time.tzset()  # set the timezone back to what is was before
+
+
+def test_freeze_with_time_zone_object() -> None:
+    with freeze_time("2012-07-14 12:00:00", tz=dateutil.tz.gettz("America/New_York")):
+        assert datetime.datetime.now() == datetime.datetime(2012, 7, 14, 8)
+        with freeze_time("2012-07-14 12:00:00"):
+            assert datetime.datetime.now() == datetime.datetime(2012, 7, 14, 12)
+        assert datetime.datetime.now() == datetime.datetime(2012, 7, 14, 8)
+
+
+def test_freeze_with_unknown_time_zone() -> None:
+    with pytest.raises(ValueError):
+        freeze_time("2012-01-14", tz="Nowhere/Special")
+
+
+def test_freeze_with_time_zone_and_tz_offset() -> None:
+    with pytest.raises(ValueError):
+        freeze_time("2012-01-14", tz="Europe/Berlin", tz_offset=2)
+
+
 @pytest.mark.skip("timezone handling is currently incorrect")
 def test_datetime_in_timezone(monkeypatch: pytest.MonkeyPatch) -> None:
     """
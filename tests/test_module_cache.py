@@ -0,0 +1,400 @@
+import datetime
+import gc
+import importlib
+import sys
+import time
+import types
+import warnings
+import weakref
+from typing import Any, Callable, List
+from unittest import mock
+
+import pytest
+
+import freezegun
+import freezegun.config
+from freezegun import api, freeze_time
+from freezegun.api import FakeDatetime, fake_time
+from tests import fake_module
+
+
+@pytest.fixture
+def fake_module_in_sys_modules(monkeypatch: pytest.MonkeyPatch) -> Callable[..., Any]:
+    """Puts a new module with the given attributes in ``sys.modules`` until the end of the test"""
+    def add_module(name: str, **attributes: Any) -> Any:
+        module = types.ModuleType(name)
+        vars(module).update(attributes)
+        monkeypatch.setitem(sys.modules, name, module)
+        return module
+    return add_module
+
+
+def test_import_recorder_is_installed_by_start() -> None:
+    with freeze_time('2012-01-14'):
+        assert api._module_import_recorder in sys.meta_path
+
+
+def test_module_imported_between_freezes_is_patched() -> None:
+    with freeze_time('2012-01-14'):
+        pass
+
+    assert 'tests.another_module' not in sys.modules
+    another_module = importlib.import_module('tests.another_module')
+    try:
+        assert 'tests.another_module' in api._imported_module_names
+
+        with freeze_time('2012-01-14'):
+            assert another_module.get_time() is fake_time
+            assert another_module.get_datetime() is FakeDatetime
+
+        assert another_module.get_time() is time.time
+        assert another_module.get_datetime() is datetime.datetime
+    finally:
+        del sys.modules['tests.another_module']
+
+
+def test_module_added_to_sys_modules_by_hand_is_patched(fake_module_in_sys_modules: Callable[..., Any]) -> None:
+    with freeze_time('2012-01-14'):
+        pass
+
+    module = fake_module_in_sys_modules('module_added_by_hand', now=time.time)
+    with freeze_time('2012-01-14'):
+        assert module.now is fake_time
+    assert module.now is time.time
+
+    del sys.modules['module_added_by_hand']
+
+    with freeze_time('2012-01-14'):
+        assert 'module_added_by_hand' not in api._seen_modules
+
+
+def test_time_object_sites_index_modules_holding_real_time_objects() -> None:
+    with freeze_time('2012-01-14'):
+        assert fake_module.time is fake_time  # type: ignore[attr-defined]
+
+    assert ('tests.fake_module', 'time') in api._time_object_sites[id(api.real_time)]
+    assert ('tests.fake_module', 'datetime') in api._time_object_sites[id(api.real_datetime)]
+    assert ('tests.fake_module', 'time') not in api._time_object_sites[id(api.real_datetime)]
+
+
+def test_time_object_sites_forget_removed_modules(fake_module_in_sys_modules: Callable[..., Any]) -> None:
+    fake_module_in_sys_modules('module_to_forget', now=time.time)
+    with freeze_time('2012-01-14'):
+        assert ('module_to_forget', 'now') in api._time_object_sites[id(api.real_time)]
+
+    del sys.modules['module_to_forget']
+
+    with freeze_time('2012-01-14'):
+        assert ('module_to_forget', 'now') not in api._time_object_sites[id(api.real_time)]
+
+
+def test_removed_module_is_not_kept_alive(fake_module_in_sys_modules: Callable[..., Any]) -> None:
+    module = fake_module_in_sys_modules('module_removed_later', now=time.time)
+    with freeze_time('2012-01-14'):
+        pass
+    assert 'module_removed_later' in api._GLOBAL_MODULES_CACHE
+
+    module_ref = weakref.ref(module)
+    del sys.modules['module_removed_later'], module
+    gc.collect()
+    assert module_ref() is None
+
+    with freeze_time('2012-01-14'):
+        pass
+    assert 'module_removed_later' not in api._GLOBAL_MODULES_CACHE
+    assert 'module_removed_later' not in api._seen_modules
+    assert ('module_removed_later', 'now') not in api._time_object_sites[id(time.time)]
+
+
+def test_binding_added_after_analysis_is_patched(fake_module_in_sys_modules: Callable[..., Any]) -> None:
+    module = fake_module_in_sys_modules('module_binding_later')
+    with freeze_time('2012-01-14'):
+        pass
+
+    module.now = time.time
+    with freeze_time('2012-01-14'):
+        assert module.now is fake_time
+    assert module.now is time.time
+
+
+def test_binding_replacing_another_name_is_patched(fake_module_in_sys_modules: Callable[..., Any]) -> None:
+    module = fake_module_in_sys_modules('module_replacing_binding', unrelated=1)
+    with freeze_time('2012-01-14'):
+        pass
+
+    # Same number of names as before
+    del module.unrelated
+    module.now = time.time
+    with freeze_time('2012-01-14'):
+        assert module.now is fake_time
+    assert module.now is time.time
+
+
+class LazyModule(types.ModuleType):
+    """A module that hands out attributes through a PEP 562 style ``__getattr__``."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.getattr_calls: List[str] = []
+
+    def __getattr__(self, name: str) -> Any:
+        self.getattr_calls.append(name)
+        if name == 'lazy_time':
+            return time.time
+        raise AttributeError(name)
+
+    def __dir__(self) -> List[str]:
+        return [*super().__dir__(), 'lazy_time']
+
+
+def test_module_getattr_is_not_triggered(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = LazyModule('lazy_module')
+    monkeypatch.setitem(sys.modules, 'lazy_module', module)
+    with freeze_time('2012-01-14'):
+        pass
+    assert module.getattr_calls == []
+
+
+def test_module_getattr_is_triggered_when_configured(monkeypatch: pytest.MonkeyPatch) -> None:
+    freezegun.configure(scan_with_getattr=['lazy_module'])
+    module = LazyModule('lazy_module')
+    monkeypatch.setitem(sys.modules, 'lazy_module', module)
+    try:
+        with freeze_time('2012-01-14'):
+            pass
+        assert 'lazy_time' in module.getattr_calls
+    finally:
+        freezegun.config.reset_config()
+
+
+def test_rebind_on_import() -> None:
+    freezegun.configure(rebind_on_import=True)
+    try:
+        with freeze_time('2012-01-14'):
+            assert vars(fake_module)['time'] is fake_time
+        # The fakes stay in place, and hand out the real time when nothing is frozen
+        assert vars(fake_module)['time'] is fake_time
+        assert vars(fake_module)['datetime'] is FakeDatetime
+        assert abs(fake_module.fake_time_function() - time.time()) < 1
+        assert fake_module.fake_datetime_function().year > 2012
+
+        another_module = importlib.import_module('tests.another_module')
+        assert another_module.get_time() is fake_time
+        assert not isinstance(another_module.__loader__, api._ImportHookLoader)
+        assert not isinstance(another_module.__spec__.loader, api._ImportHookLoader)  # type: ignore[union-attr]
+
+        with freeze_time('2012-01-14'):
+            assert another_module.get_datetime().now() == datetime.datetime(2012, 1, 14)
+    finally:
+        sys.modules.pop('tests.another_module', None)
+        freezegun.config.reset_config()
+        api._update_rebinding()
+
+    assert vars(fake_module)['time'] is time.time
+    assert vars(fake_module)['datetime'] is datetime.datetime
+
+
+def test_install_fakes() -> None:
+    freezegun.install_fakes()
+    try:
+        assert time.time is fake_time
+        assert vars(fake_module)['time'] is fake_time
+        assert abs(time.time() - api.real_time()) < 1
+
+        with mock.patch('freezegun.api._update_module_cache') as update_module_cache:
+            with freeze_time('2012-01-14'):
+                assert datetime.datetime is FakeDatetime
+                assert time.time() == 1326499200.0
+                assert fake_module.fake_datetime_function() == datetime.datetime(2012, 1, 14)
+        update_module_cache.assert_not_called()
+
+        assert time.time is fake_time
+        assert datetime.datetime is api.real_datetime
+        assert fake_module.fake_datetime_function().year > 2012
+    finally:
+        freezegun.uninstall_fakes()
+
+    assert time.time is api.real_time
+    assert datetime.datetime is api.real_datetime
+    assert vars(fake_module)['time'] is api.real_time
+
+
+def test_install_fakes_while_frozen() -> None:
+    with freeze_time('2012-01-14'):
+        with pytest.raises(RuntimeError):
+            freezegun.install_fakes()
+
+
+def test_uninstall_fakes_while_frozen() -> None:
+    freezegun.install_fakes()
+    try:
+        with freeze_time('2012-01-14'):
+            with pytest.raises(RuntimeError):
+                freezegun.uninstall_fakes()
+        assert vars(fake_module)['time'] is fake_time
+    finally:
+        freezegun.uninstall_fakes()
+
+    assert time.time is api.real_time
+    assert vars(fake_module)['time'] is api.real_time
+    assert vars(fake_module)['datetime'] is api.real_datetime
+
+
+def test_keep_fakes_installed() -> None:
+    freezegun.configure(keep_fakes_installed=True)
+    try:
+        with freeze_time('2012-01-14'):
+            pass
+        assert time.time is fake_time
+    finally:
+        freezegun.config.reset_config()
+        freezegun.uninstall_fakes()
+    assert time.time is api.real_time
+
+
+def test_ignore_with_fakes_installed() -> None:
+    freezegun.install_fakes()
+    try:
+        with freeze_time('2012-01-14', ignore=['tests.fake_module']):
+            assert fake_module.fake_datetime_function().year > 2012
+            assert fake_module.fake_date_function().year > 2012
+            assert fake_module.fake_time_function() > 1326499200
+            assert datetime.datetime.now() == datetime.datetime(2012, 1, 14)
+    finally:
+        freezegun.uninstall_fakes()
+
+
+def test_ignore_with_rebind_on_import() -> None:
+    freezegun.configure(rebind_on_import=True)
+    try:
+        with freeze_time('2012-01-14', ignore=['tests.fake_module']):
+            assert fake_module.fake_datetime_function().year > 2012
+            assert fake_module.fake_date_function().year > 2012
+            assert datetime.date.today() == datetime.date(2012, 1, 14)
+    finally:
+        freezegun.config.reset_config()
+        api._update_rebinding()
+
+
+def test_module_without_time_objects_is_not_enumerated(fake_module_in_sys_modules: Callable[..., Any]) -> None:
+    with freeze_time('2012-01-14'):
+        pass
+
+    module = fake_module_in_sys_modules('module_without_time_objects', value=42)
+    with mock.patch('freezegun.api._get_module_attributes', wraps=api._get_module_attributes) as get_module_attributes:
+        with freeze_time('2012-01-14'):
+            pass
+    assert 'module_without_time_objects' not in [call.args[0] for call in get_module_attributes.call_args_list]
+    assert api._GLOBAL_MODULES_CACHE['module_without_time_objects'][2] == ()
+
+    # Once it does hold one, it gets picked up again
+    module.now = time.time
+    with freeze_time('2012-01-14'):
+        assert module.now is fake_time
+
+
+def test_modules_outside_patch_only_are_parked(fake_module_in_sys_modules: Callable[..., Any]) -> None:
+    module = fake_module_in_sys_modules('module_outside_patch_only', now=time.time)
+    with freeze_time('2012-01-14', patch_only=['tests']):
+        assert module.now is api.real_time
+    assert 'module_outside_patch_only' not in api._modules_to_analyze
+
+    # The next freeze with the same scope doesn't look at it again
+    with mock.patch('freezegun.api._is_module_in_scope', wraps=api._is_module_in_scope) as is_module_in_scope:
+        with freeze_time('2012-01-14', patch_only=['tests']):
+            pass
+    assert 'module_outside_patch_only' not in [call.args[0] for call in is_module_in_scope.call_args_list]
+
+    # A freeze that wants it still gets it patched
+    with freeze_time('2012-01-14'):
+        assert module.now is fake_time
+
+
+def test_warmup(fake_module_in_sys_modules: Callable[..., Any]) -> None:
+    fake_module_in_sys_modules('module_warmed_up', now=time.time)
+    freezegun.warmup()
+    assert api._GLOBAL_MODULES_CACHE['module_warmed_up'][2] == (('now', time.time),)
+    assert 'module_warmed_up' not in api._modules_to_analyze
+
+
+def test_warmup_in_background(fake_module_in_sys_modules: Callable[..., Any]) -> None:
+    module = fake_module_in_sys_modules('module_warmed_up_in_background', now=time.time)
+    thread = freezegun.warmup(background=True)
+    assert thread is not None
+    with freeze_time('2012-01-14'):
+        assert module.now is fake_time
+    thread.join()
+    assert 'module_warmed_up_in_background' in api._GLOBAL_MODULES_CACHE
+
+
+def test_warmup_in_background_leaves_getattr_scans_to_the_foreground(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, 'namespace_warmed_up', types.SimpleNamespace(__name__='namespace_warmed_up', now=time.time))
+    with mock.patch('warnings.catch_warnings', wraps=warnings.catch_warnings) as catch_warnings:
+        thread = freezegun.warmup(background=True)
+        assert thread is not None
+        thread.join()
+    assert catch_warnings.call_count == 0
+    assert 'namespace_warmed_up' in api._modules_to_analyze
+
+    freezegun.warmup()
+    assert api._GLOBAL_MODULES_CACHE['namespace_warmed_up'][2] == (('now', time.time),)
+
+
+def test_module_imported_while_frozen_is_restored_without_analysis() -> None:
+    with freeze_time('2012-01-14'):
+        pass
+
+    try:
+        with mock.patch('freezegun.api._setup_module_cache', wraps=api._setup_module_cache) as setup_module_cache:
+            with freeze_time('2012-01-14'):
+                another_module = importlib.import_module('tests.another_module')
+                assert another_module.get_time() is fake_time
+        assert 'tests.another_module' not in [call.args[0] for call in setup_module_cache.call_args_list]
+        assert another_module.get_time() is time.time
+        assert another_module.get_datetime() is datetime.datetime
+
+        # The analysis happens on the next freeze instead
+        with freeze_time('2012-01-14'):
+            assert another_module.get_time() is fake_time
+            assert 'tests.another_module' in api._GLOBAL_MODULES_CACHE
+        assert another_module.get_time() is time.time
+    finally:
+        sys.modules.pop('tests.another_module', None)
+
+
+def test_stop_does_not_fingerprint_cached_modules() -> None:
+    freezer = freeze_time('2012-01-14')
+    freezer.start()
+    with mock.patch('freezegun.api._get_module_fingerprint', wraps=api._get_module_fingerprint) as get_module_fingerprint:
+        freezer.stop()
+    assert get_module_fingerprint.call_count == 0
+
+
+@pytest.mark.skipif(not api._time_object_refcounts_usable, reason="the reference counts of the time objects can't be relied on")
+def test_start_only_fingerprints_cached_modules_after_a_time_object_got_bound(fake_module_in_sys_modules: Callable[..., Any]) -> None:
+    with freeze_time('2012-01-14'):
+        pass
+
+    with mock.patch('freezegun.api._get_module_fingerprint', wraps=api._get_module_fingerprint) as get_module_fingerprint:
+        with freeze_time('2012-01-14'):
+            pass
+    assert get_module_fingerprint.call_count == 0
+
+    module = fake_module_in_sys_modules('module_binding_in_place')
+    with freeze_time('2012-01-14'):
+        pass
+    module.now = time.time
+    with mock.patch('freezegun.api._get_module_fingerprint', wraps=api._get_module_fingerprint) as get_module_fingerprint:
+        with freeze_time('2012-01-14'):
+            assert module.now is fake_time
+    assert get_module_fingerprint.call_count > 0
+
+
+def test_binding_is_patched_without_reference_counts(fake_module_in_sys_modules: Callable[..., Any]) -> None:
+    module = fake_module_in_sys_modules('module_binding_without_refcounts')
+    with mock.patch('freezegun.api._time_object_refcounts_usable', False):
+        with freeze_time('2012-01-14'):
+            pass
+        module.now = time.time
+        with freeze_time('2012-01-14'):
+            assert module.now is fake_time
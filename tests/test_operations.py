@@ -42,6 +42,43 @@ def test_subtraction() -> None:
     assert isinstance(how_long, datetime.timedelta)
 
 
+@freeze_time("2012-01-14")
+def test_reflected_addition() -> None:
+    later = datetime.timedelta(days=1) + datetime.datetime.now()
+    tomorrow = datetime.timedelta(days=1) + datetime.date.today()
+    assert utils.is_fake_datetime(later)
+    assert utils.is_fake_date(tomorrow)
+    assert later == datetime.datetime(2012, 1, 15)
+    assert tomorrow == datetime.date(2012, 1, 15)
+
+
+@freeze_time("2012-01-14")
+def test_fakes_have_no_dict() -> None:
+    for value in (datetime.datetime.now(), datetime.date.today()):
+        assert not hasattr(value, '__dict__')
+        with pytest.raises(AttributeError):
+            value.some_attribute = 1  # type: ignore[attr-defined]
+
+
+def test_now_follows_tick() -> None:
+    with freeze_time("2012-01-14 23:59:59") as frozen_datetime:
+        assert datetime.datetime.now() == datetime.datetime(2012, 1, 14, 23, 59, 59)
+        assert datetime.date.today() == datetime.date(2012, 1, 14)
+        frozen_datetime.tick()
+        assert datetime.datetime.now() == datetime.datetime(2012, 1, 15)
+        assert datetime.date.today() == datetime.date(2012, 1, 15)
+
+
+def test_now_follows_tz_offset() -> None:
+    with freeze_time("2012-01-14 12:00", tz_offset=-4):
+        assert datetime.datetime.now() == datetime.datetime(2012, 1, 14, 8)
+        with freeze_time("2012-01-14 12:00", tz_offset=14):
+            assert datetime.datetime.now() == datetime.datetime(2012, 1, 15, 2)
+            assert datetime.date.today() == datetime.date(2012, 1, 15)
+        assert datetime.datetime.now() == datetime.datetime(2012, 1, 14, 8)
+        assert datetime.date.today() == datetime.date(2012, 1, 14)
+
+
 @freeze_time("2012-01-14")
 def test_datetime_timezone_none() -> None:
     now = datetime.datetime.now(tz=None)
@@ -1,6 +1,6 @@
 import datetime
 import pickle
-from freezegun import freeze_time
+from freezegun import api, freeze_time
 
 
 def assert_pickled_datetimes_equal_original() -> None:
@@ -58,3 +58,17 @@ def test_pickle_real_date() -> None:
 
     assert pickle.loads(pickle.dumps(fake_date)) == fake_date
     assert pickle.loads(pickle.dumps(real_date)) == real_date
+
+
+def test_pickle_real_datetime_with_fakes_installed() -> None:
+    api.install_fakes()
+    try:
+        with freeze_time("1970-01-01"):
+            pass
+        # Outside of a freeze, real datetimes are pickled as they are
+        assert b'FakeDatetime' not in pickle.dumps(api.real_datetime(1970, 2, 1))
+        assert b'FakeDate' not in pickle.dumps(api.real_date(1970, 2, 1))
+        with freeze_time("1970-01-01"):
+            assert b'FakeDatetime' in pickle.dumps(api.real_datetime(1970, 2, 1))
+    finally:
+        api.uninstall_fakes()
@@ -0,0 +1,32 @@
+import pytest
+
+pytest_plugins = ['pytester']
+
+
+def test_plugin_fills_module_cache_before_first_test(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(test_warmed_up_by_plugin='''
+        from time import time
+
+        from freezegun import api
+
+
+        def test_module_is_analyzed():
+            assert 'test_warmed_up_by_plugin' in api._GLOBAL_MODULES_CACHE
+            assert 'test_warmed_up_by_plugin' not in api._modules_to_analyze
+    ''')
+    result = pytester.runpytest('-p', 'freezegun.pytest_plugin')
+    result.assert_outcomes(passed=1)
+
+
+def test_without_plugin_module_cache_is_not_filled(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(test_not_warmed_up='''
+        from time import time
+
+        from freezegun import api
+
+
+        def test_module_is_not_analyzed():
+            assert 'test_not_warmed_up' not in api._GLOBAL_MODULES_CACHE
+    ''')
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1)
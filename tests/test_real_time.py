@@ -0,0 +1,53 @@
+import asyncio
+import datetime
+import time
+from unittest import mock
+
+from freezegun import freeze_time, real_time
+
+
+@freeze_time('2012-01-14')
+def test_real_time_context_manager() -> None:
+    with real_time():
+        assert time.time() > 1326499200.0
+        assert time.monotonic() > 0
+        assert datetime.datetime.now().year > 2012
+        assert datetime.datetime.utcnow().year > 2012
+        assert datetime.date.today().year > 2012
+        assert time.strftime('%Y') != '2012'
+    assert time.time() == 1326499200.0
+    assert datetime.date.today() == datetime.date(2012, 1, 14)
+
+
+@freeze_time('2012-01-14')
+def test_real_time_decorator() -> None:
+    @real_time()
+    def read_time() -> float:
+        return time.time()
+
+    assert read_time() > 1326499200.0
+    assert time.time() == 1326499200.0
+
+
+@freeze_time('2012-01-14')
+def test_real_time_does_not_inspect_the_call_stack() -> None:
+    with mock.patch('freezegun.api.sys._getframe') as getframe:
+        with real_time():
+            time.time()
+    getframe.assert_not_called()
+
+
+def test_real_time_carries_over_to_tasks() -> None:
+    async def read_time() -> float:
+        return time.time()
+
+    @real_time()
+    async def read_time_in_task() -> float:
+        return await asyncio.create_task(read_time())
+
+    async def coroutine() -> None:
+        with freeze_time('2012-01-14'):
+            assert await read_time_in_task() > 1326499200.0
+            assert await asyncio.create_task(read_time()) == 1326499200.0
+
+    asyncio.run(coroutine())
@@ -0,0 +1,115 @@
+import datetime
+import time
+from time import sleep
+from unittest import mock
+
+import pytest
+
+import freezegun
+from freezegun import api, freeze_time
+from tests import utils
+
+
+@freeze_time('2012-01-14', instant_sleep=True)
+def test_instant_sleep() -> None:
+    start = api.real_monotonic()
+    time.sleep(3600)
+    assert api.real_monotonic() - start < 60
+    assert datetime.datetime.now() == datetime.datetime(2012, 1, 14, 1)
+    assert time.monotonic() == 1326502800.0
+
+
+@freeze_time('2012-01-14', instant_sleep=True)
+def test_instant_sleep_imported_function() -> None:
+    sleep(1.5)
+    assert time.time() == 1326499201.5
+
+
+@freeze_time('2012-01-14', instant_sleep=True)
+def test_instant_sleep_negative() -> None:
+    with pytest.raises(ValueError):
+        time.sleep(-1)
+
+
+def test_instant_sleep_zero_with_auto_tick() -> None:
+    with freeze_time('2012-01-14', auto_tick_seconds=5, instant_sleep=True) as frozen_datetime:
+        time.sleep(0)
+        assert frozen_datetime.time_to_freeze == datetime.datetime(2012, 1, 14)
+        time.sleep(1)
+        assert frozen_datetime.time_to_freeze == datetime.datetime(2012, 1, 14, 0, 0, 1)
+
+
+@freeze_time('2012-01-14')
+def test_sleep_without_instant_sleep() -> None:
+    time.sleep(0.001)
+    assert time.time() == 1326499200.0
+
+
+def test_instant_sleep_nested() -> None:
+    with freeze_time('2012-01-14', instant_sleep=True):
+        with freeze_time('2013-01-14'):
+            time.sleep(0.001)
+            assert time.time() == 1358121600.0
+        time.sleep(60)
+        assert datetime.datetime.now() == datetime.datetime(2012, 1, 14, 0, 1)
+
+
+@utils.cpython_only
+def test_instant_sleep_ticking() -> None:
+    with freeze_time('2012-01-14', tick=True, instant_sleep=True):
+        before = time.time()
+        time.sleep(60)
+        assert time.time() - before >= 60
+
+
+def test_sleep_is_only_patched_for_instant_sleep() -> None:
+    with freeze_time('2012-01-14'):
+        assert time.sleep is api.real_sleep
+        with freeze_time('2012-01-14', instant_sleep=True):
+            assert time.sleep is api.fake_sleep
+        assert time.sleep is api.real_sleep
+    assert time.sleep is api.real_sleep
+
+
+def test_mocked_sleep_around_freeze() -> None:
+    with mock.patch('time.sleep') as mocked_sleep:
+        with freeze_time('2012-01-14'):
+            time.sleep(60)
+            assert time.time() == 1326499200.0
+        mocked_sleep.assert_called_once_with(60)
+        assert time.sleep is mocked_sleep
+
+        with freeze_time('2012-01-14', instant_sleep=True):
+            time.sleep(60)
+            assert time.time() == 1326499260.0
+            with freeze_time('2012-01-14'):
+                # Freezes without instant_sleep hand the sleeping back to the mock
+                time.sleep(1)
+        assert mocked_sleep.call_count == 2
+        assert time.sleep is mocked_sleep
+    assert time.sleep is api.real_sleep
+
+
+def test_imported_sleep_is_only_patched_for_instant_sleep() -> None:
+    with mock.patch('time.sleep') as mocked_sleep:
+        with freeze_time('2012-01-14'):
+            # The module holds the real sleep, which a mock of time.sleep doesn't reach
+            assert globals()['sleep'] is api.real_sleep
+            with freeze_time('2012-01-14', instant_sleep=True):
+                assert globals()['sleep'] is api.fake_sleep
+            assert globals()['sleep'] is api.real_sleep
+        mocked_sleep.assert_not_called()
+    assert globals()['sleep'] is api.real_sleep
+
+
+def test_imported_sleep_with_rebind_on_import() -> None:
+    freezegun.configure(rebind_on_import=True)
+    try:
+        with freeze_time('2012-01-14'):
+            assert globals()['sleep'] is api.real_sleep
+        with freeze_time('2012-01-14', instant_sleep=True):
+            assert globals()['sleep'] is api.fake_sleep
+        assert globals()['sleep'] is api.real_sleep
+    finally:
+        freezegun.config.reset_config()
+        api._update_rebinding()
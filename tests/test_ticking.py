@@ -5,7 +5,7 @@ import time
 from unittest import mock
 import pytest
 
-from freezegun import freeze_time
+from freezegun import api, freeze_time
 from tests import utils
 
 @utils.cpython_only
@@ -87,6 +87,47 @@ def test_ticking_move_to() -> None:
         assert datetime.datetime.now().replace(second=0, microsecond=0) == datetime.datetime(2012, 1, 15, 1, 0, 0)
 
 
+@utils.cpython_only
+def test_ticking_ignores_wall_clock_changes() -> None:
+    with mock.patch('freezegun.api.real_perf_counter_ns', return_value=5000000000) as perf_counter_ns:
+        with freeze_time("Jan 14th, 2012", tick=True):
+            # Only the time passed on perf_counter_ns() counts, whatever the wall clock does
+            perf_counter_ns.return_value += 1500000001
+            assert time.time_ns() == 1326499201500000001
+            assert datetime.datetime.now() == datetime.datetime(2012, 1, 14, 0, 0, 1, 500000)
+
+
+@utils.cpython_only
+def test_ticking_at_rate() -> None:
+    with mock.patch('freezegun.api.real_perf_counter_ns', return_value=5000000000) as perf_counter_ns:
+        with freeze_time("Jan 14th, 2012", tick=True, rate=60):
+            start = time.monotonic_ns()
+            perf_counter_ns.return_value += 1000000000
+            assert datetime.datetime.now() == datetime.datetime(2012, 1, 14, 0, 1)
+            assert time.monotonic_ns() - start == 60000000000
+
+        with freeze_time("Jan 14th, 2012", tick=True, rate=0.5):
+            perf_counter_ns.return_value += 1000000000
+            assert time.time() == 1326499200.5
+
+
+def test_ticking_factory_with_wall_clock_start() -> None:
+    # The factory used to take the wall clock time the freeze started at
+    time_to_freeze = datetime.datetime(2012, 1, 14)
+    start = api.real_datetime.now() - datetime.timedelta(seconds=10)
+    factory = api.TickingDateTimeFactory(time_to_freeze, start)
+    assert isinstance(factory.start, int)
+    assert time_to_freeze + datetime.timedelta(seconds=10) <= factory() < time_to_freeze + datetime.timedelta(seconds=70)
+
+
+@utils.cpython_only
+def test_rate_without_ticking() -> None:
+    with pytest.raises(ValueError):
+        freeze_time("Jan 14th, 2012", rate=60)
+    with pytest.raises(ValueError):
+        freeze_time("Jan 14th, 2012", tick=True, rate=0)
+
+
 @utils.cpython_only_mark
 @pytest.mark.parametrize("func_name",
     ("monotonic", "monotonic_ns", "perf_counter", "perf_counter_ns"),